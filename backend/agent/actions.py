@@ -9,13 +9,13 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from backend.agent.states import GraphState
 from backend.models.presentation import AgentState, AudioType
+from backend.utils import yaml_load
 
 logger = logging.getLogger(__name__)
 
+
 def _get_audio_file(slide: int) -> str:
     """Get the audio filename for a given slide index."""
     slide_audio_map = _load_slide_audio_map()
@@ -28,7 +28,7 @@ def _load_slide_audio_map() -> dict[int, str]:
     config_path = Path(__file__).resolve().parent.parent.parent / "config" / "presentation.yaml"
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_load(f) or {}
     except FileNotFoundError:
         logger.warning(f"Presentation config not found at {config_path}")
         return {}
@@ -52,7 +52,7 @@ def _load_question_audio_map() -> dict[int, str]:
     config_path = Path(__file__).resolve().parent.parent.parent / "config" / "presentation.yaml"
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_load(f) or {}
     except FileNotFoundError:
         logger.warning(f"Presentation config not found at {config_path}")
         return {}
@@ -259,93 +259,116 @@ def outro_node(state: GraphState) -> dict:
     }
 
 
-def route_next_command(state: GraphState) -> dict:
-    """Router node — checks the pending command and decides the next state."""
-    pending = state.get("pending_command")
-    if not pending:
-        logger.info("No pending command, staying idle.")
-        return {"agent_state": AgentState.IDLE, "pending_command": None, "ws_messages": []}
+def _route_intro(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.INTRODUCING}
 
-    cmd_type = pending.get("type", "")
-    payload = pending.get("payload", {})
-    logger.info(f"Routing command: {cmd_type}")
 
-    result: dict[str, Any] = {"pending_command": None, "ws_messages": []}
+def _route_start(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.PRESENTING, "current_slide": 2}
+
 
-    if cmd_type == "intro":
-        result["agent_state"] = AgentState.INTRODUCING
+def _route_next(state: GraphState, payload: dict) -> dict:
+    next_slide = min(state["current_slide"] + 1, state["total_slides"] - 1)
+    return {"agent_state": AgentState.PRESENTING, "current_slide": next_slide}
 
-    elif cmd_type == "start":
-        result["agent_state"] = AgentState.PRESENTING
-        result["current_slide"] = 2
 
-    elif cmd_type == "next":
-        next_slide = min(state["current_slide"] + 1, state["total_slides"] - 1)
-        result["agent_state"] = AgentState.PRESENTING
-        result["current_slide"] = next_slide
+def _route_prev(state: GraphState, payload: dict) -> dict:
+    prev_slide = max(state["current_slide"] - 1, 0)
+    return {"agent_state": AgentState.PRESENTING, "current_slide": prev_slide}
 
-    elif cmd_type == "prev":
-        prev_slide = max(state["current_slide"] - 1, 0)
-        result["agent_state"] = AgentState.PRESENTING
-        result["current_slide"] = prev_slide
 
-    elif cmd_type == "goto":
-        slide_num = payload.get("slide_number", 0)
-        slide_num = max(0, min(slide_num, state["total_slides"] - 1))
-        result["agent_state"] = AgentState.PRESENTING
-        result["current_slide"] = slide_num
+def _route_goto(state: GraphState, payload: dict) -> dict:
+    slide_num = payload.get("slide_number", 0)
+    slide_num = max(0, min(slide_num, state["total_slides"] - 1))
+    return {"agent_state": AgentState.PRESENTING, "current_slide": slide_num}
 
-    elif cmd_type == "ask":
-        result["agent_state"] = AgentState.ASKING
-        result["current_target"] = payload.get("target_name", "")
-        result["current_question"] = payload.get("question", "")
 
-    elif cmd_type == "answer":
-        result["agent_state"] = AgentState.RESPONDING
-        result["last_answer_summary"] = payload.get("summary", "")
+def _route_ask(state: GraphState, payload: dict) -> dict:
+    return {
+        "agent_state": AgentState.ASKING,
+        "current_target": payload.get("target_name", ""),
+        "current_question": payload.get("question", ""),
+    }
 
-    elif cmd_type == "example":
-        result["agent_state"] = AgentState.RESPONDING
-        result["last_answer_summary"] = "__example__"
 
-    elif cmd_type == "qa":
-        result["agent_state"] = AgentState.QA_MODE
+def _route_answer(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.RESPONDING, "last_answer_summary": payload.get("summary", "")}
 
-    elif cmd_type == "pick":
-        result["agent_state"] = AgentState.QA_MODE
-        result["current_qa_question_id"] = payload.get("question_id")
 
-    elif cmd_type == "outro":
-        result["agent_state"] = AgentState.OUTRO
+def _route_example(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.RESPONDING, "last_answer_summary": "__example__"}
 
-    elif cmd_type == "resume":
-        prev = state.get("previous_state", AgentState.IDLE)
-        result["agent_state"] = prev if prev else AgentState.IDLE
 
-    elif cmd_type == "skip":
-        result["agent_state"] = AgentState.IDLE
+def _route_qa(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.QA_MODE}
 
-    else:
-        result["agent_state"] = AgentState.IDLE
 
+def _route_pick(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.QA_MODE, "current_qa_question_id": payload.get("question_id")}
+
+
+def _route_outro(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.OUTRO}
+
+
+def _route_resume(state: GraphState, payload: dict) -> dict:
+    prev = state.get("previous_state", AgentState.IDLE)
+    return {"agent_state": prev if prev else AgentState.IDLE}
+
+
+def _route_idle(state: GraphState, payload: dict) -> dict:
+    return {"agent_state": AgentState.IDLE}
+
+
+# Command type -> handler returning the state update for that command
+_ROUTES = {
+    "intro": _route_intro,
+    "start": _route_start,
+    "next": _route_next,
+    "prev": _route_prev,
+    "goto": _route_goto,
+    "ask": _route_ask,
+    "answer": _route_answer,
+    "example": _route_example,
+    "qa": _route_qa,
+    "pick": _route_pick,
+    "outro": _route_outro,
+    "resume": _route_resume,
+    "skip": _route_idle,
+}
+
+
+def route_next_command(state: GraphState) -> dict:
+    """Router node — checks the pending command and decides the next state."""
+    pending = state.get("pending_command")
+    if not pending:
+        logger.info("No pending command, staying idle.")
+        return {"agent_state": AgentState.IDLE, "pending_command": None, "ws_messages": []}
+
+    cmd_type = pending.get("type", "")
+    payload = pending.get("payload", {})
+    logger.info(f"Routing command: {cmd_type}")
+
+    result: dict[str, Any] = {"pending_command": None, "ws_messages": []}
+    result.update(_ROUTES.get(cmd_type, _route_idle)(state, payload))
     return result
 
 
+# Agent state -> graph node; states without a node (e.g. PAUSED) fall back to idle
+_STATE_TO_NODE = {
+    AgentState.IDLE: "idle",
+    AgentState.INTRODUCING: "introducing",
+    AgentState.PRESENTING: "presenting",
+    AgentState.ASKING: "asking",
+    AgentState.WAITING_ANSWER: "waiting_answer",
+    AgentState.RESPONDING: "responding",
+    AgentState.TRANSITIONING: "transitioning",
+    AgentState.QA_MODE: "qa_mode",
+    AgentState.OUTRO: "outro",
+    AgentState.DONE: "__end__",
+}
+
+
 def decide_next_state(state: GraphState) -> str:
     """Conditional edge function — returns the name of the next node."""
-    agent_state = state.get("agent_state", AgentState.IDLE)
-
-    state_to_node = {
-        AgentState.IDLE: "idle",
-        AgentState.INTRODUCING: "introducing",
-        AgentState.PRESENTING: "presenting",
-        AgentState.ASKING: "asking",
-        AgentState.WAITING_ANSWER: "waiting_answer",
-        AgentState.RESPONDING: "responding",
-        AgentState.TRANSITIONING: "transitioning",
-        AgentState.QA_MODE: "qa_mode",
-        AgentState.OUTRO: "outro",
-        AgentState.DONE: "__end__",
-    }
-
-    return state_to_node.get(agent_state, "idle")
+    return _STATE_TO_NODE.get(state.get("agent_state", AgentState.IDLE), "idle")
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """A parsed slash command or free-text input."""
     type: str
@@ -18,13 +18,60 @@ class Command:
 
 
 # Commands that bypass the queue and execute immediately
-INTERRUPT_COMMANDS = {"pause", "stop"}
+INTERRUPT_COMMANDS = frozenset({"pause", "stop"})
+
+# Commands without arguments (anything after the name is ignored)
+_SIMPLE_COMMANDS = frozenset({
+    "intro", "start", "next", "prev", "example", "qa", "questions", "outro",
+    "pause", "resume", "skip", "status", "video", "audio",
+})
+
+# Commands whose arguments are parsed (see _ARG_PARSERS)
+_ARG_COMMANDS = frozenset({"goto", "ask", "pick"})
 
 # All recognized slash commands
-VALID_COMMANDS = {
-    "intro", "start", "next", "prev", "goto", "ask", "example",
-    "qa", "pick", "questions", "outro", "pause", "resume", "skip", "status",
-    "video", "audio",
+VALID_COMMANDS = _SIMPLE_COMMANDS | _ARG_COMMANDS
+
+_COMMAND_RE = re.compile(r"^/(\w+)\s*(.*)", re.DOTALL)
+_ASK_WITH_QUESTION_RE = re.compile(r"^(\w+):\s*(.+)", re.DOTALL)
+_ASK_NAME_ONLY_RE = re.compile(r"^(\w+)\s*$")
+
+
+def _parse_goto(args: str) -> tuple[dict, Optional[str]]:
+    try:
+        return {"slide_number": int(args)}, None
+    except ValueError:
+        return {}, f"/goto requires a slide number, got: '{args}'"
+
+
+def _parse_ask(args: str) -> tuple[dict, Optional[str]]:
+    # Format 1: /ask Name: Custom question   (custom question override)
+    # Format 2: /ask Name                     (auto-pull question from current slide)
+    ask_with_question = _ASK_WITH_QUESTION_RE.match(args)
+    if ask_with_question:
+        return {
+            "target_name": ask_with_question.group(1),
+            "question": ask_with_question.group(2).strip(),
+        }, None
+    ask_name_only = _ASK_NAME_ONLY_RE.match(args)
+    if ask_name_only:
+        # question will be auto-filled from slide config in handle_command
+        return {"target_name": ask_name_only.group(1), "question": ""}, None
+    return {}, "Format: /ask Name  OR  /ask Name: Custom question"
+
+
+def _parse_pick(args: str) -> tuple[dict, Optional[str]]:
+    try:
+        return {"question_id": int(args)}, None
+    except ValueError:
+        return {}, f"/pick requires a question ID, got: '{args}'"
+
+
+# Argument parsers for commands that take arguments: args -> (payload, error)
+_ARG_PARSERS = {
+    "goto": _parse_goto,
+    "ask": _parse_ask,
+    "pick": _parse_pick,
 }
 
 
@@ -62,59 +109,24 @@ def parse_command(text: str) -> Command:
         )
 
     # Extract command name and arguments
-    match = re.match(r"^/(\w+)\s*(.*)", text, re.DOTALL)
+    match = _COMMAND_RE.match(text)
     if not match:
         return Command(type="unknown", payload={"error": f"Could not parse: {text}"}, raw_text=text)
 
     cmd_name = match.group(1).lower()
-    args = match.group(2).strip()
 
-    if cmd_name not in VALID_COMMANDS:
+    if cmd_name in _SIMPLE_COMMANDS:
+        priority = 1 if cmd_name in INTERRUPT_COMMANDS else 0
+        return Command(type=cmd_name, priority=priority, raw_text=text)
+
+    if cmd_name not in _ARG_COMMANDS:
         return Command(type="unknown", payload={"error": f"Unknown command: /{cmd_name}"}, raw_text=text)
 
-    priority = 1 if cmd_name in INTERRUPT_COMMANDS else 0
-    payload = {}
-
-    if cmd_name == "goto":
-        try:
-            payload["slide_number"] = int(args)
-        except ValueError:
-            return Command(
-                type="error",
-                payload={"error": f"/goto requires a slide number, got: '{args}'"},
-                raw_text=text,
-            )
-
-    elif cmd_name == "ask":
-        # Format 1: /ask Name: Custom question   (custom question override)
-        # Format 2: /ask Name                     (auto-pull question from current slide)
-        ask_with_question = re.match(r"^(\w+):\s*(.+)", args, re.DOTALL)
-        ask_name_only = re.match(r"^(\w+)\s*$", args)
-        if ask_with_question:
-            payload["target_name"] = ask_with_question.group(1)
-            payload["question"] = ask_with_question.group(2).strip()
-        elif ask_name_only:
-            payload["target_name"] = ask_name_only.group(1)
-            # question will be auto-filled from slide config in handle_command
-            payload["question"] = ""
-        else:
-            return Command(
-                type="error",
-                payload={"error": "Format: /ask Name  OR  /ask Name: Custom question"},
-                raw_text=text,
-            )
-
-    elif cmd_name == "pick":
-        try:
-            payload["question_id"] = int(args)
-        except ValueError:
-            return Command(
-                type="error",
-                payload={"error": f"/pick requires a question ID, got: '{args}'"},
-                raw_text=text,
-            )
-
-    return Command(type=cmd_name, payload=payload, priority=priority, raw_text=text)
+    payload, error = _ARG_PARSERS[cmd_name](match.group(2).strip())
+    if error is not None:
+        return Command(type="error", payload={"error": error}, raw_text=text)
+
+    return Command(type=cmd_name, payload=payload, raw_text=text)
 
 
 class CommandQueue:
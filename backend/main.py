@@ -12,7 +12,6 @@ import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import yaml
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -30,10 +29,13 @@ from backend.services.llm_service import (
 )
 from backend.services.question_manager import QuestionManager
 from backend.services.tts_service import (
+    close_client as close_tts_client,
     is_configured as tts_is_configured,
-    stream_speech_as_base64,
+    refresh_config as refresh_tts_config,
+    stream_speech_as_binary,
     synthesize_speech,
 )
+from backend.utils import yaml_load
 
 load_dotenv()
 
@@ -67,7 +69,7 @@ def _load_audience_config() -> dict:
     config_path = Path(__file__).parent.parent / "config" / "audience.yaml"
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml_load(f)
             _audience_config = {
                 member["name"].lower(): member
                 for member in data.get("audience", [])
@@ -88,7 +90,7 @@ def _load_presentation_config() -> dict:
     config_path = Path(__file__).parent.parent / "config" / "presentation.yaml"
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            _presentation_config = yaml.safe_load(f)
+            _presentation_config = yaml_load(f)
     except FileNotFoundError:
         logger.warning(f"Presentation config not found at {config_path}")
         _presentation_config = {}
@@ -177,12 +179,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Loaded {len(_audience_config)} audience members.")
     _validate_audio_files()
     _hydrate_questions_from_supabase()
+    refresh_tts_config()
     if tts_is_configured():
         logger.info("ElevenLabs TTS configured and ready for live responses.")
     else:
         logger.warning("ElevenLabs TTS NOT configured. Live responses will use text fallback.")
     yield
     logger.info("DexIQ AI Presenter shutting down.")
+    await close_tts_client()
 
 
 # --- FastAPI App ---
@@ -471,6 +475,24 @@ async def _play_commentary_audio(audio_url: str, status_message: str) -> dict:
     return {"status": "ok", "message": status_message}
 
 
+async def _stream_live_audio(text: str):
+    """Stream live TTS to the presenter screen.
+
+    The avatar switches to speaking_live when the first audio frame arrives
+    rather than when the request is sent, so it never mouths along to the
+    silence while ElevenLabs is still synthesizing.
+    """
+    speaking = False
+    async for frame in stream_speech_as_binary(text):
+        if not speaking:
+            await presenter.broadcast_to_presenters({
+                "type": "show_avatar",
+                "data": {"mode": "speaking_live"},
+            })
+            speaking = True
+        await presenter.broadcast_bytes_to_presenters(frame)
+
+
 async def _process_audience_response(answer_summary: str) -> dict:
     """Process an audience member's answer and generate a live AI response.
 
@@ -530,14 +552,9 @@ async def _process_audience_response(answer_summary: str) -> dict:
                 "type": "stream_audio_start",
                 "data": {"responseText": response_text, "playbackToken": playback_token},
             })
-            await presenter.broadcast_to_presenters({
-                "type": "show_avatar",
-                "data": {"mode": "speaking_live"},
-            })
 
             # Stream audio chunks to presenter
-            async for chunk_msg in stream_speech_as_base64(response_text):
-                await presenter.broadcast_to_presenters(chunk_msg)
+            await _stream_live_audio(response_text)
         else:
             # No TTS configured — show text only
             logger.warning("ElevenLabs not configured. Showing response text only.")
@@ -619,13 +636,8 @@ async def _process_qa_pick(question_id: int) -> dict:
                 "type": "stream_audio_start",
                 "data": {"responseText": answer_text, "playbackToken": playback_token},
             })
-            await presenter.broadcast_to_presenters({
-                "type": "show_avatar",
-                "data": {"mode": "speaking_live"},
-            })
 
-            async for chunk_msg in stream_speech_as_base64(answer_text):
-                await presenter.broadcast_to_presenters(chunk_msg)
+            await _stream_live_audio(answer_text)
         else:
             logger.warning("ElevenLabs not configured. Showing answer text only.")
             await presenter.broadcast_to_presenters({
@@ -9,8 +9,13 @@ from typing import Optional, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from backend.utils import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Constant reply, serialized once
+_PONG = json_dumps({"type": "pong", "data": {}})
+
 router = APIRouter()
 
 # Active control WebSocket connections
@@ -19,10 +24,11 @@ _control_connections: Set[WebSocket] = set()
 
 async def send_to_control(message: dict):
     """Send a message to all connected control interfaces."""
+    text = json_dumps(message)
     disconnected = set()
     for ws in _control_connections:
         try:
-            await ws.send_json(message)
+            await ws.send_text(text)
         except Exception:
             disconnected.add(ws)
 
@@ -42,13 +48,13 @@ async def control_websocket(websocket: WebSocket):
     logger.info(f"Control interface connected. Total: {len(_control_connections)}")
 
     try:
-        await websocket.send_json({
+        await websocket.send_text(json_dumps({
             "type": "connected",
             "data": {"message": "Control interface connected to DexIQ backend."},
-        })
+        }))
 
         while True:
-            data = await websocket.receive_json()
+            data = json_loads(await websocket.receive_text())
             msg_type = data.get("type", "")
 
             if msg_type == "command":
@@ -59,13 +65,13 @@ async def control_websocket(websocket: WebSocket):
                 from backend.main import handle_command
                 result = await handle_command(raw_text)
 
-                await websocket.send_json({
+                await websocket.send_text(json_dumps({
                     "type": "command_result",
                     "data": result,
-                })
+                }))
 
             elif msg_type == "ping":
-                await websocket.send_json({"type": "pong", "data": {}})
+                await websocket.send_text(_PONG)
 
     except WebSocketDisconnect:
         logger.info("Control interface disconnected.")
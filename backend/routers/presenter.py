@@ -13,6 +13,8 @@ from typing import Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from backend.utils import json_dumps
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -22,11 +24,33 @@ _presenter_connections: Set[WebSocket] = set()
 
 
 async def broadcast_to_presenters(message: dict):
-    """Broadcast a message to all connected presenter screens."""
+    """Broadcast a message to all connected presenter screens.
+
+    The message is serialized once and the same text frame is sent to
+    every connection.
+    """
+    await broadcast_text_to_presenters(json_dumps(message))
+
+
+async def broadcast_text_to_presenters(text: str):
+    """Broadcast an already-serialized JSON message to all presenter screens."""
+    disconnected = set()
+    for ws in _presenter_connections:
+        try:
+            await ws.send_text(text)
+        except Exception:
+            disconnected.add(ws)
+
+    for ws in disconnected:
+        _presenter_connections.discard(ws)
+
+
+async def broadcast_bytes_to_presenters(frame: bytes):
+    """Broadcast a binary frame (e.g. streamed audio) to all presenter screens."""
     disconnected = set()
     for ws in _presenter_connections:
         try:
-            await ws.send_json(message)
+            await ws.send_bytes(frame)
         except Exception:
             disconnected.add(ws)
 
@@ -39,7 +63,8 @@ async def presenter_websocket(websocket: WebSocket):
     """WebSocket endpoint for the presenter screen.
 
     The presenter screen connects here and receives JSON messages
-    with commands to control slides, audio, and avatar.
+    with commands to control slides, audio, and avatar. Live TTS audio
+    arrives as binary frames (see tts_service.stream_speech_as_binary).
     """
     await websocket.accept()
     _presenter_connections.add(websocket)
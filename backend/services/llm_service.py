@@ -7,10 +7,11 @@ import logging
 import os
 from typing import Optional
 
-import yaml
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+from backend.utils import yaml_load
+
 logger = logging.getLogger(__name__)
 
 # Load prompts from config
@@ -28,7 +29,7 @@ def _load_prompts() -> dict:
     )
     try:
         with open(prompts_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml_load(f)
             _prompts_cache = data.get("system_prompts", {})
     except FileNotFoundError:
         logger.warning(f"Prompts file not found at {prompts_path}, using defaults.")
@@ -9,27 +9,51 @@ Supports two modes:
 """
 
 import asyncio
-import base64
+import importlib.util
 import json
 import logging
 import os
+import random
 import time
-from typing import AsyncGenerator, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
 
+import aiofiles
 import httpx
 
+try:
+    # SIMD-accelerated (AVX2/AVX-512) base64 — much faster on the streaming path
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from binascii import b2a_base64
+
+    def _b64encode(data: bytes) -> bytes:
+        # base64.b64encode is a Python wrapper around this same C function
+        return b2a_base64(data, newline=False)
+
+
 logger = logging.getLogger(__name__)
 
 ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
 
-# Default voice settings — configurable via .env
-# Values match ElevenLabs UI percentages: 50% = 0.5, 75% = 0.75, etc.
-DEFAULT_VOICE_SETTINGS = {
-    "stability": float(os.getenv("ELEVENLABS_STABILITY", "0.5")),
-    "similarity_boost": float(os.getenv("ELEVENLABS_SIMILARITY_BOOST", "0.75")),
-    "style": float(os.getenv("ELEVENLABS_STYLE", "0.0")),
-    "use_speaker_boost": os.getenv("ELEVENLABS_SPEAKER_BOOST", "false").lower() == "true",
-}
+
+def _read_voice_settings() -> dict:
+    """Read voice settings from the environment.
+
+    Values match ElevenLabs UI percentages: 50% = 0.5, 75% = 0.75, etc.
+    """
+    return {
+        "stability": float(os.getenv("ELEVENLABS_STABILITY", "0.5")),
+        "similarity_boost": float(os.getenv("ELEVENLABS_SIMILARITY_BOOST", "0.75")),
+        "style": float(os.getenv("ELEVENLABS_STYLE", "0.0")),
+        "use_speaker_boost": os.getenv("ELEVENLABS_SPEAKER_BOOST", "false").lower() == "true",
+    }
+
+
+# Default voice settings — configurable via .env.
+# Shared by reference in every payload; it is only serialized, never mutated.
+DEFAULT_VOICE_SETTINGS = _read_voice_settings()
 
 # Model selection
 DEFAULT_MODEL = os.getenv("ELEVENLABS_MODEL", "eleven_flash_v2_5")
@@ -37,26 +61,121 @@ DEFAULT_MODEL = os.getenv("ELEVENLABS_MODEL", "eleven_flash_v2_5")
 # Output format: mp3_44100_128 is a good balance of quality and size
 DEFAULT_OUTPUT_FORMAT = os.getenv("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")
 
+# Streaming: bytes per aiter_bytes() iteration. ElevenLabs delivers audio far
+# faster than real time, so once this is past ~1 KB time-to-first-byte is
+# bounded by when upstream starts sending, not by the size; bigger reads just
+# mean fewer Python-level iterations. Override with TTS_STREAM_CHUNK.
+STREAM_CHUNK_SIZE = int(os.getenv("TTS_STREAM_CHUNK", "8192"))
+
+# Streaming: coalesce small upstream chunks into ~16 KB / 40 ms WebSocket messages
+STREAM_FLUSH_BYTES = 16384
+STREAM_FLUSH_DELAY_MS = 40.0
+
+# Base64-encode blocks larger than this in a worker thread (pybase64 releases
+# the GIL while encoding); smaller ones are cheaper to encode than to hand off
+B64_OFFLOAD_BYTES = 32768
+
+# Binary audio frame types (first byte of each stream_speech_as_binary frame)
+AUDIO_FRAME_CHUNK = b"\x01"
+AUDIO_FRAME_FINAL = b"\x02"
+
+# Shared HTTP client, created lazily by _get_client()
+_client: httpx.AsyncClient | None = None
+
+# Statuses worth retrying in synthesize_speech (rate limited / temporarily unavailable)
+RETRYABLE_STATUSES = {429, 503}
+
+# Longest Retry-After (seconds) worth waiting out during a live response; a
+# server asking for more gets the error raised instead of a stalled presenter
+RETRY_AFTER_MAX = 10.0
+
+# Retry backoff; module-level so tests can skip the waits for this module only
+_sleep = asyncio.sleep
+
+# Circuit breaker: after this many consecutive failed calls (rate limits, 5xx,
+# network errors) fail fast for BREAKER_COOLDOWN seconds, then let one call
+# through to probe whether ElevenLabs has recovered.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+_breaker = {"failures": 0, "opened_at": 0.0}
+
+# Account metadata changes on human timescales — cache it (seconds)
+CREDITS_CACHE_TTL = 60.0
+VOICES_CACHE_TTL = 3600.0
+
+# key -> (fetched_at monotonic timestamp, value)
+_cache: dict[str, tuple[float, Any]] = {}
+
+# Credentials cached on first use (after .env has been loaded)
+_api_key: str | None = None
+_voice_id: str | None = None
+
+
+def refresh_config():
+    """Re-read ElevenLabs settings from the environment.
+
+    Call after the environment changes (e.g. once .env is loaded, or in tests).
+    """
+    global DEFAULT_VOICE_SETTINGS, DEFAULT_MODEL, DEFAULT_OUTPUT_FORMAT, STREAM_CHUNK_SIZE
+    global _api_key, _voice_id
+    DEFAULT_VOICE_SETTINGS = _read_voice_settings()
+    DEFAULT_MODEL = os.getenv("ELEVENLABS_MODEL", "eleven_flash_v2_5")
+    DEFAULT_OUTPUT_FORMAT = os.getenv("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")
+    STREAM_CHUNK_SIZE = int(os.getenv("TTS_STREAM_CHUNK", "8192"))
+    _api_key = None
+    _voice_id = None
+    if _client is not None:
+        _client.headers["xi-api-key"] = _get_api_key()
+
 
 def _get_api_key() -> str:
     """Get ElevenLabs API key."""
-    key = os.getenv("ELEVENLABS_API_KEY", "")
-    if not key:
-        logger.warning("ELEVENLABS_API_KEY not set. Live TTS will fail.")
-    return key
+    global _api_key
+    if _api_key is None:
+        _api_key = os.getenv("ELEVENLABS_API_KEY", "")
+        if not _api_key:
+            logger.warning("ELEVENLABS_API_KEY not set. Live TTS will fail.")
+    return _api_key
 
 
-def _get_headers() -> dict:
-    """Get ElevenLabs API headers."""
-    return {
-        "xi-api-key": _get_api_key(),
-        "Content-Type": "application/json",
-    }
+# httpx only speaks HTTP/2 with the optional h2 package (httpx[http2]); without
+# it, http2=True raises ImportError on first use, so fall back to HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Get the shared ElevenLabs HTTP client, creating it on first use.
+
+    Reusing one client keeps the TLS connection to ElevenLabs warm, so
+    live TTS requests skip the TCP + TLS handshake.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        if not _HTTP2_AVAILABLE:
+            logger.warning("h2 not installed (pip install httpx[http2]); using HTTP/1.1 for ElevenLabs.")
+        _client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            headers={"xi-api-key": _get_api_key()},
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 def _get_voice_id() -> str:
     """Get the configured ElevenLabs voice ID."""
-    return os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")  # Default: Rachel
+    global _voice_id
+    if _voice_id is None:
+        _voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")  # Default: Rachel
+    return _voice_id
 
 
 def _build_payload(text: str, model: str | None = None) -> dict:
@@ -68,6 +187,110 @@ def _build_payload(text: str, model: str | None = None) -> dict:
     }
 
 
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _breaker_check():
+    """Fail fast while the circuit is open; let one probe through after the cooldown.
+
+    Raises:
+        RuntimeError: If the circuit is open.
+    """
+    if _breaker["failures"] < BREAKER_THRESHOLD:
+        return
+    now = time.monotonic()
+    if now - _breaker["opened_at"] < BREAKER_COOLDOWN:
+        raise RuntimeError("TTS circuit open: ElevenLabs is failing, not calling it")
+    # Half-open: restart the cooldown so concurrent calls keep failing fast
+    # while this one probes the API
+    _breaker["opened_at"] = now
+    logger.info("TTS circuit half-open. Probing ElevenLabs...")
+
+
+def _breaker_record(error: Exception | None = None):
+    """Record the outcome of an ElevenLabs call (None means success)."""
+    if error is None:
+        if _breaker["failures"] >= BREAKER_THRESHOLD:
+            logger.info("TTS circuit closed. ElevenLabs recovered.")
+        _breaker["failures"] = 0
+        return
+
+    # Only count signs of a degraded API, not bad requests or bad credentials
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status not in RETRYABLE_STATUSES and status < 500:
+            return
+    elif not isinstance(error, httpx.TransportError):
+        return
+
+    _breaker["failures"] += 1
+    if _breaker["failures"] >= BREAKER_THRESHOLD:
+        if _breaker["failures"] == BREAKER_THRESHOLD:
+            logger.warning(
+                f"TTS circuit open after {BREAKER_THRESHOLD} consecutive failures. "
+                f"Failing fast for {BREAKER_COOLDOWN:.0f}s."
+            )
+        _breaker["opened_at"] = time.monotonic()
+
+
+async def _stream_audio(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: dict,
+    params: dict,
+    output_path: Optional[str] = None,
+) -> bytes:
+    """POST a TTS request and collect the audio as it arrives.
+
+    Chunks are accumulated into a single bytearray (one final bytes() copy
+    rather than repeated concatenation). Callers get the whole clip back, so
+    memory stays proportional to the clip length even when saving to disk.
+
+    If output_path is given, chunks are also written to ``<output_path>.part``
+    as they come in, and the part file replaces output_path only once the
+    response has completed; a failed or interrupted stream never leaves a
+    truncated file at output_path.
+    """
+    audio = bytearray()
+    async with client.stream("POST", url, json=payload, params=params) as response:
+        if response.is_error:
+            await response.aread()  # so the error handler can log the body
+        response.raise_for_status()
+
+        if output_path is None:
+            async for chunk in response.aiter_bytes(65536):
+                audio.extend(chunk)
+        else:
+            part_path = output_path + ".part"
+            try:
+                async with aiofiles.open(part_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(65536):
+                        await f.write(chunk)
+                        audio.extend(chunk)
+                os.replace(part_path, output_path)
+            finally:
+                # Only left behind by a failed or interrupted stream
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
+    return bytes(audio)
+
+
 async def synthesize_speech(
     text: str,
     output_path: Optional[str] = None,
@@ -87,7 +310,10 @@ async def synthesize_speech(
 
     Raises:
         httpx.HTTPStatusError: If the API request fails after retries.
+        RuntimeError: If the circuit breaker is open after repeated failures.
     """
+    _breaker_check()
+
     voice_id = _get_voice_id()
     url = f"{ELEVENLABS_BASE_URL}/text-to-speech/{voice_id}"
     params = {"output_format": DEFAULT_OUTPUT_FORMAT}
@@ -95,48 +321,61 @@ async def synthesize_speech(
 
     start_time = time.monotonic()
 
+    client = await _get_client()
+
     for attempt in range(max_retries + 1):
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    url, json=payload, headers=_get_headers(), params=params
-                )
-                response.raise_for_status()
-                audio_bytes = response.content
+        try:
+            audio_bytes = await _stream_audio(client, url, payload, params, output_path)
 
-                elapsed = time.monotonic() - start_time
-                logger.info(
-                    f"TTS synthesized {len(text)} chars -> {len(audio_bytes)} bytes "
-                    f"in {elapsed:.2f}s (model: {payload['model_id']})"
-                )
+            elapsed = time.monotonic() - start_time
+            logger.info(
+                f"TTS synthesized {len(text)} chars -> {len(audio_bytes)} bytes "
+                f"in {elapsed:.2f}s (model: {payload['model_id']})"
+            )
+
+            if output_path:
+                logger.info(f"Audio saved to {output_path}")
+
+            _breaker_record()
+            return audio_bytes
 
-                if output_path:
-                    with open(output_path, "wb") as f:
-                        f.write(audio_bytes)
-                    logger.info(f"Audio saved to {output_path}")
-
-                return audio_bytes
-
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code
-                if status == 429 and attempt < max_retries:
-                    wait = 2 ** attempt
-                    logger.warning(f"Rate limited (429). Retrying in {wait}s... (attempt {attempt + 1})")
-                    await asyncio.sleep(wait)
-                    continue
-                logger.error(f"ElevenLabs API error: {status} - {e.response.text}")
-                raise
-            except (httpx.ConnectError, httpx.ReadTimeout) as e:
-                if attempt < max_retries:
-                    wait = 2 ** attempt
-                    logger.warning(f"Connection error: {e}. Retrying in {wait}s...")
-                    await asyncio.sleep(wait)
-                    continue
-                logger.error(f"ElevenLabs TTS connection failed after {max_retries + 1} attempts: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"ElevenLabs TTS error: {e}")
-                raise
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status in RETRYABLE_STATUSES and attempt < max_retries:
+                # Honor Retry-After when given; jitter keeps clients from retrying in lockstep
+                retry_after = _retry_after_seconds(e.response)
+                if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+                    logger.error(
+                        f"ElevenLabs returned {status} with Retry-After {retry_after:.0f}s "
+                        f"(over {RETRY_AFTER_MAX:.0f}s). Not retrying."
+                    )
+                    _breaker_record(e)
+                    raise
+                source = "header" if retry_after is not None else "backoff"
+                base = retry_after if retry_after is not None else 2 ** attempt
+                wait = min(max(base, 0.5) + random.uniform(0, 0.5 * 2 ** attempt), RETRY_AFTER_MAX)
+                logger.warning(
+                    f"ElevenLabs returned {status}. Retrying in {wait:.1f}s "
+                    f"({source})... (attempt {attempt + 1})"
+                )
+                await _sleep(wait)
+                continue
+            logger.error(f"ElevenLabs API error: {status} - {e.response.text}")
+            _breaker_record(e)
+            raise
+        except (httpx.ConnectError, httpx.ReadTimeout) as e:
+            if attempt < max_retries:
+                wait = 2 ** attempt
+                logger.warning(f"Connection error: {e}. Retrying in {wait}s...")
+                await _sleep(wait)
+                continue
+            logger.error(f"ElevenLabs TTS connection failed after {max_retries + 1} attempts: {e}")
+            _breaker_record(e)
+            raise
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS error: {e}")
+            _breaker_record(e)
+            raise
 
     # Should not reach here, but just in case
     raise RuntimeError("TTS synthesis failed after all retries")
@@ -145,7 +384,7 @@ async def synthesize_speech(
 async def stream_speech(
     text: str,
     model: Optional[str] = None,
-    chunk_size: int = 1024,
+    chunk_size: Optional[int] = None,
 ) -> AsyncGenerator[bytes, None]:
     """Stream speech synthesis from ElevenLabs HTTP streaming API.
 
@@ -155,11 +394,13 @@ async def stream_speech(
     Args:
         text: The text to convert to speech.
         model: Override the default model. Use "eleven_turbo_v2_5" for lowest latency.
-        chunk_size: Size of audio chunks to yield (bytes).
+        chunk_size: Size of audio chunks to yield (bytes). Defaults to STREAM_CHUNK_SIZE.
 
     Yields:
         Audio bytes chunks (MP3 format).
     """
+    _breaker_check()
+
     voice_id = _get_voice_id()
     url = f"{ELEVENLABS_BASE_URL}/text-to-speech/{voice_id}/stream"
     params = {"output_format": DEFAULT_OUTPUT_FORMAT}
@@ -169,126 +410,288 @@ async def stream_speech(
     total_bytes = 0
     chunk_count = 0
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            async with client.stream(
-                "POST", url, json=payload, headers=_get_headers(), params=params
-            ) as response:
-                response.raise_for_status()
-
-                first_chunk = True
-                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                    if first_chunk:
-                        ttfb = time.monotonic() - start_time
-                        logger.info(f"TTS stream first chunk in {ttfb:.2f}s")
-                        first_chunk = False
-
-                    total_bytes += len(chunk)
-                    chunk_count += 1
-                    yield chunk
+    client = await _get_client()
 
-            elapsed = time.monotonic() - start_time
-            logger.info(
-                f"TTS stream complete: {chunk_count} chunks, "
-                f"{total_bytes} bytes in {elapsed:.2f}s"
-            )
+    try:
+        async with client.stream("POST", url, json=payload, params=params) as response:
+            if response.is_error:
+                await response.aread()  # so the error handler can log the body
+            response.raise_for_status()
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"ElevenLabs stream error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"ElevenLabs stream error: {e}")
-            raise
+            first_chunk = True
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size or STREAM_CHUNK_SIZE):
+                if first_chunk:
+                    ttfb = time.monotonic() - start_time
+                    logger.info(f"TTS stream first chunk in {ttfb:.2f}s")
+                    first_chunk = False
+
+                total_bytes += len(chunk)
+                chunk_count += 1
+                yield chunk
+
+        elapsed = time.monotonic() - start_time
+        logger.info(
+            f"TTS stream complete: {chunk_count} chunks, "
+            f"{total_bytes} bytes in {elapsed:.2f}s"
+        )
+        _breaker_record()
+
+    except httpx.HTTPStatusError as e:
+        logger.error(f"ElevenLabs stream error: {e.response.status_code} - {e.response.text}")
+        _breaker_record(e)
+        raise
+    except Exception as e:
+        logger.error(f"ElevenLabs stream error: {e}")
+        _breaker_record(e)
+        raise
+
+
+async def _prefetch(agen: AsyncGenerator[bytes, None]) -> AsyncGenerator[bytes, None]:
+    """Re-yield items from an async generator, fetching the next one in the background.
+
+    While the consumer processes the current item (encoding, WebSocket send),
+    the read of the next item from the network is already in flight.
+    """
+    pending = asyncio.ensure_future(agen.__anext__())
+    try:
+        while True:
+            try:
+                item = await pending
+            except StopAsyncIteration:
+                return
+            pending = asyncio.ensure_future(agen.__anext__())
+            yield item
+    finally:
+        if not pending.done():
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        await agen.aclose()
+
+
+async def _coalesce(
+    agen: AsyncGenerator[bytes, None],
+    min_bytes: int,
+    max_delay_ms: float,
+) -> AsyncGenerator[bytes, None]:
+    """Merge small chunks from ``agen`` into larger blocks.
+
+    A block is emitted once it holds at least ``min_bytes`` or its first byte
+    is older than ``max_delay_ms``. Any remainder is emitted at the end.
+    """
+    buf = bytearray()
+    first_byte_at = 0.0
+    max_delay = max_delay_ms / 1000.0
+
+    async for chunk in agen:
+        if not buf:
+            first_byte_at = time.monotonic()
+        buf.extend(chunk)
+
+        if len(buf) < min_bytes and time.monotonic() - first_byte_at < max_delay:
+            continue
+
+        yield bytes(buf)
+        buf.clear()
+
+    if buf:
+        yield bytes(buf)
+
+
+async def _b64encode_block(block: bytes) -> bytes:
+    """Base64-encode an audio block, off the event loop if it is large."""
+    if len(block) > B64_OFFLOAD_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(None, _b64encode, block)
+    return _b64encode(block)
+
+
+def _speech_blocks(
+    text: str,
+    model: Optional[str],
+    chunk_size: Optional[int],
+    min_chunk_bytes: int,
+    max_delay_ms: float,
+) -> AsyncGenerator[bytes, None]:
+    """stream_speech() with read-ahead, coalesced into message-sized blocks."""
+    upstream = _prefetch(stream_speech(text, model=model, chunk_size=chunk_size))
+    return _coalesce(upstream, min_chunk_bytes, max_delay_ms)
+
+
+def _audio_chunk_message(chunk: str, index: int, final: bool = False) -> dict:
+    """Build an audio_chunk WebSocket message."""
+    return {
+        "type": "audio_chunk",
+        "data": {
+            "chunk": chunk,
+            "index": index,
+            "final": final,
+        },
+    }
+
+
+async def stream_speech_as_binary(
+    text: str,
+    model: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    min_chunk_bytes: int = STREAM_FLUSH_BYTES,
+    max_delay_ms: float = STREAM_FLUSH_DELAY_MS,
+) -> AsyncGenerator[bytes, None]:
+    """Stream speech as binary WebSocket frames (no base64, no JSON).
+
+    Each frame is a 1-byte frame type, a 4-byte big-endian chunk index,
+    then the raw MP3 bytes:
+        AUDIO_FRAME_CHUNK + index + <mp3 bytes>
+        AUDIO_FRAME_FINAL + index            (end of stream, no payload)
+
+    Args:
+        text: The text to convert to speech.
+        model: Override the default model.
+        chunk_size: Size of raw audio chunks read from the HTTP stream
+            (defaults to STREAM_CHUNK_SIZE).
+        min_chunk_bytes: Flush the buffer once it holds at least this many bytes.
+        max_delay_ms: Flush the buffer once its oldest byte is this old.
+
+    Yields:
+        Binary frames ready for WebSocket.send_bytes().
+    """
+    index = 0
+    async for block in _speech_blocks(text, model, chunk_size, min_chunk_bytes, max_delay_ms):
+        yield AUDIO_FRAME_CHUNK + index.to_bytes(4, "big") + block
+        index += 1
+
+    yield AUDIO_FRAME_FINAL + index.to_bytes(4, "big")
 
 
 async def stream_speech_as_base64(
     text: str,
     model: Optional[str] = None,
-    chunk_size: int = 4096,
+    chunk_size: Optional[int] = None,
+    min_chunk_bytes: int = STREAM_FLUSH_BYTES,
+    max_delay_ms: float = STREAM_FLUSH_DELAY_MS,
 ) -> AsyncGenerator[dict, None]:
     """Stream speech and yield base64-encoded chunks ready for WebSocket transport.
 
     Each yielded dict has the format:
         {"type": "audio_chunk", "data": {"chunk": <base64>, "index": N, "final": bool}}
 
-    This is designed to be sent directly over the presenter WebSocket.
+    Small upstream chunks are coalesced until ``min_chunk_bytes`` have been
+    buffered or ``max_delay_ms`` has passed since the first buffered byte,
+    so each message carries a reasonably sized payload.
 
     Args:
         text: The text to convert to speech.
         model: Override the default model.
-        chunk_size: Size of raw audio chunks before base64 encoding.
+        chunk_size: Size of raw audio chunks read from the HTTP stream
+            (defaults to STREAM_CHUNK_SIZE).
+        min_chunk_bytes: Flush the buffer once it holds at least this many bytes.
+        max_delay_ms: Flush the buffer once its oldest byte is this old.
 
     Yields:
-        Dicts with base64-encoded audio chunks.
+        Dicts with audio_chunk type and base64-encoded audio data.
     """
     index = 0
-    async for chunk in stream_speech(text, model=model, chunk_size=chunk_size):
-        b64_chunk = base64.b64encode(chunk).decode("utf-8")
-        yield {
-            "type": "audio_chunk",
-            "data": {
-                "chunk": b64_chunk,
-                "index": index,
-                "final": False,
-            },
-        }
+    async for block in _speech_blocks(text, model, chunk_size, min_chunk_bytes, max_delay_ms):
+        encoded = await _b64encode_block(block)
+        yield _audio_chunk_message(encoded.decode("ascii"), index)
         index += 1
 
     # Send final marker
-    yield {
-        "type": "audio_chunk",
-        "data": {
-            "chunk": "",
-            "index": index,
-            "final": True,
-        },
-    }
+    yield _audio_chunk_message("", index, final=True)
+
+
+async def _cached(key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return a cached value younger than ``ttl`` seconds, or fetch a fresh one.
+
+    Failed fetches (None) are not cached.
+    """
+    hit = _cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+
+    value = await fetch()
+    if value is not None:
+        _cache[key] = (time.monotonic(), value)
+    return value
+
+
+def invalidate_cache(key: str | None = None):
+    """Drop one cached entry ("credits" or "voices"), or all of them."""
+    if key is None:
+        _cache.clear()
+    else:
+        _cache.pop(key, None)
 
 
 async def get_remaining_credits() -> Optional[int]:
-    """Check remaining ElevenLabs API credits.
+    """Check remaining ElevenLabs API credits (cached for CREDITS_CACHE_TTL seconds).
 
     Returns:
         Remaining character credits, or None if check fails.
     """
+    return await _cached("credits", CREDITS_CACHE_TTL, _fetch_remaining_credits)
+
+
+async def _fetch_remaining_credits() -> Optional[int]:
+    """Fetch remaining credits from the ElevenLabs API."""
     url = f"{ELEVENLABS_BASE_URL}/user/subscription"
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(url, headers=_get_headers())
-            response.raise_for_status()
-            data = response.json()
-            remaining = data.get("character_limit", 0) - data.get("character_count", 0)
-            logger.info(f"ElevenLabs credits remaining: {remaining:,}")
-            return remaining
-        except Exception as e:
-            logger.error(f"Failed to check ElevenLabs credits: {e}")
-            return None
+    client = await _get_client()
+
+    try:
+        response = await client.get(url, timeout=10.0)
+        response.raise_for_status()
+        data = response.json()
+        remaining = data.get("character_limit", 0) - data.get("character_count", 0)
+        logger.info(f"ElevenLabs credits remaining: {remaining:,}")
+        return remaining
+    except Exception as e:
+        logger.error(f"Failed to check ElevenLabs credits: {e}")
+        return None
 
 
 async def list_voices() -> list[dict] | None:
-    """List available ElevenLabs voices.
+    """List available ElevenLabs voices (cached for VOICES_CACHE_TTL seconds).
 
     Returns:
         List of voice dicts with voice_id and name, or None on failure.
     """
+    return await _cached("voices", VOICES_CACHE_TTL, _fetch_voices)
+
+
+async def _fetch_voices() -> list[dict] | None:
+    """Fetch the voice list from the ElevenLabs API."""
     url = f"{ELEVENLABS_BASE_URL}/voices"
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(url, headers=_get_headers())
-            response.raise_for_status()
-            data = response.json()
-            voices = [
-                {"voice_id": v["voice_id"], "name": v["name"], "category": v.get("category", "")}
-                for v in data.get("voices", [])
-            ]
-            return voices
-        except Exception as e:
-            logger.error(f"Failed to list voices: {e}")
-            return None
+    client = await _get_client()
+
+    try:
+        response = await client.get(url, timeout=10.0)
+        response.raise_for_status()
+        data = response.json()
+        voices = [
+            {"voice_id": v["voice_id"], "name": v["name"], "category": v.get("category", "")}
+            for v in data.get("voices", [])
+        ]
+        return voices
+    except Exception as e:
+        logger.error(f"Failed to list voices: {e}")
+        return None
 
 
 def is_configured() -> bool:
     """Check if ElevenLabs API is configured (API key and voice ID set)."""
     return bool(os.getenv("ELEVENLABS_API_KEY")) and bool(os.getenv("ELEVENLABS_VOICE_ID"))
+
+
+async def get_status() -> dict:
+    """Report configuration and remaining credits in one call.
+
+    Credits are only requested when the API is configured, over the shared
+    pooled client (and through the credits cache).
+
+    Returns:
+        Dict with ``configured`` (bool) and ``credits`` (int, or None if
+        unconfigured or the check failed).
+    """
+    configured = is_configured()
+    credits = await get_remaining_credits() if configured else None
+    return {"configured": configured, "credits": credits}
@@ -0,0 +1,42 @@
+"""Shared YAML and JSON helpers.
+
+Use the fast native parsers when they are installed (libyaml, orjson) and
+fall back to the pure-Python ones otherwise; callers get the same results
+either way.
+"""
+
+import json
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_load(stream):
+    """Safely parse YAML from a string, bytes, or open file."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to compact JSON text."""
+        return orjson.dumps(obj).decode()
+
+    def json_dumps_indented(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON indented by two spaces, for files."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def json_dumps_indented(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON indented by two spaces, for files."""
+        return json.dumps(obj, indent=2).encode("utf-8")
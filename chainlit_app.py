@@ -6,7 +6,6 @@ with the FastAPI backend via WebSocket.
 """
 
 import asyncio
-import json
 import logging
 import os
 
@@ -15,6 +14,15 @@ import websockets
 
 from dotenv import load_dotenv
 
+from backend.utils import json_dumps, json_loads
+
+try:
+    from websockets.protocol import State as _WSState
+
+    _WS_OPEN = _WSState.OPEN
+except ImportError:
+    _WS_OPEN = None
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -25,101 +33,120 @@ BACKEND_WS_URL = os.getenv("BACKEND_WS_URL", "ws://localhost:8000/ws/control")
 # Global WebSocket connection
 _ws_connection = None
 _ws_listener_task = None
+_ws_lock = asyncio.Lock()
 
 
 def _ws_is_open(ws) -> bool:
-    """Check if a WebSocket connection is open (compatible with websockets v13+)."""
-    if ws is None:
-        return False
-    try:
-        return ws.open
-    except AttributeError:
-        pass
-    try:
-        from websockets.protocol import State
-        return ws.protocol.state is State.OPEN
-    except (AttributeError, ImportError):
+    """Check if a WebSocket connection is open (compatible with websockets v12 and v13+)."""
+    if ws is None or _WS_OPEN is None:
         return False
+    # v13+ connections wrap a Sans-I/O protocol object; legacy ones expose .state directly
+    protocol = getattr(ws, "protocol", ws)
+    return getattr(protocol, "state", None) is _WS_OPEN
 
 
 async def _get_ws():
-    """Get or create the WebSocket connection to the backend."""
+    """Get or create the WebSocket connection to the backend.
+
+    Guarded by a lock so concurrent callers during a backend restart share
+    one reconnect instead of each opening (and leaking) a socket.
+    """
     global _ws_connection
-    if not _ws_is_open(_ws_connection):
-        try:
-            _ws_connection = await websockets.connect(BACKEND_WS_URL)
-            logger.info(f"Connected to backend at {BACKEND_WS_URL}")
-        except Exception as e:
-            logger.error(f"Failed to connect to backend: {e}")
-            raise
+    if _ws_is_open(_ws_connection):
+        return _ws_connection
+
+    async with _ws_lock:
+        if not _ws_is_open(_ws_connection):
+            try:
+                _ws_connection = await websockets.connect(
+                    BACKEND_WS_URL,
+                    ping_interval=20,
+                    ping_timeout=10,
+                    max_size=2**22,
+                    compression=None,  # JSON control traffic is tiny; deflate is wasted CPU
+                )
+                logger.info(f"Connected to backend at {BACKEND_WS_URL}")
+            except Exception as e:
+                logger.error(f"Failed to connect to backend: {e}")
+                raise
     return _ws_connection
 
 
+async def _on_connected(data: dict):
+    await cl.Message(
+        content="✅ **Connected to DexIQ backend.**\n\nType `/intro` to begin the presentation.",
+        author="System",
+    ).send()
+
+
+async def _on_command_result(result: dict):
+    status = result.get("status", "")
+    if status == "error":
+        await cl.Message(
+            content=f"❌ **Error:** {result.get('message', 'Unknown error')}",
+            author="System",
+        ).send()
+    elif result.get("message"):
+        await cl.Message(
+            content=result["message"],
+            author="System",
+        ).send()
+
+
+async def _on_status_update(update: dict):
+    state = update.get("state", "")
+    message_text = update.get("message", "")
+    slide = update.get("slide", "")
+
+    slide_part = f" | **Slide:** {slide}" if slide else ""
+    message_part = f"\n{message_text}" if message_text else ""
+    status_line = f"**State:** `{state}`{slide_part}{message_part}"
+
+    await cl.Message(content=status_line, author="DexIQ").send()
+
+
+async def _on_response_generated(resp: dict):
+    target = resp.get("target", "")
+    response = resp.get("response", "")
+    await cl.Message(
+        content=f"🗣️ **Response to {target}:**\n\n> {response}",
+        author="DexIQ",
+    ).send()
+
+
+async def _on_new_question(q: dict):
+    score = q.get("score", "?")
+    flag = q.get("flag", "")
+    flag_text = f" ⚠️ `{flag}`" if flag else ""
+    await cl.Message(
+        content=f"❓ **New Q&A question** (#{q.get('id')}, score: {score}{flag_text}):\n"
+                f"**{q.get('name', 'Anonymous')}:** {q.get('question', '')}",
+        author="System",
+    ).send()
+
+
+# Backend message type -> handler (called with the message's "data" payload).
+# Types without a handler (e.g. "pong" heartbeats) are ignored.
+HANDLERS = {
+    "connected": _on_connected,
+    "command_result": _on_command_result,
+    "status_update": _on_status_update,
+    "response_generated": _on_response_generated,
+    "new_question": _on_new_question,
+}
+
+
 async def _listen_for_updates():
     """Background task that listens for status updates from the backend."""
     while True:
         try:
             ws = await _get_ws()
             message = await ws.recv()
-            data = json.loads(message)
-            msg_type = data.get("type", "")
-
-            if msg_type == "connected":
-                await cl.Message(
-                    content="✅ **Connected to DexIQ backend.**\n\nType `/intro` to begin the presentation.",
-                    author="System",
-                ).send()
-
-            elif msg_type == "command_result":
-                result = data.get("data", {})
-                status = result.get("status", "")
-                if status == "error":
-                    await cl.Message(
-                        content=f"❌ **Error:** {result.get('message', 'Unknown error')}",
-                        author="System",
-                    ).send()
-                elif result.get("message"):
-                    await cl.Message(
-                        content=result["message"],
-                        author="System",
-                    ).send()
-
-            elif msg_type == "status_update":
-                update = data.get("data", {})
-                state = update.get("state", "")
-                message_text = update.get("message", "")
-                slide = update.get("slide", "")
-
-                status_line = f"**State:** `{state}`"
-                if slide:
-                    status_line += f" | **Slide:** {slide}"
-                if message_text:
-                    status_line += f"\n{message_text}"
-
-                await cl.Message(content=status_line, author="DexIQ").send()
-
-            elif msg_type == "response_generated":
-                resp = data.get("data", {})
-                target = resp.get("target", "")
-                response = resp.get("response", "")
-                await cl.Message(
-                    content=f"🗣️ **Response to {target}:**\n\n> {response}",
-                    author="DexIQ",
-                ).send()
-
-            elif msg_type == "new_question":
-                q = data.get("data", {})
-                score = q.get("score", "?")
-                flag = q.get("flag", "")
-                flag_text = f" ⚠️ `{flag}`" if flag else ""
-                await cl.Message(
-                    content=f"❓ **New Q&A question** (#{q.get('id')}, score: {score}{flag_text}):\n"
-                            f"**{q.get('name', 'Anonymous')}:** {q.get('question', '')}",
-                    author="System",
-                ).send()
-
-            elif msg_type == "pong":
-                pass  # Heartbeat response
+            data = json_loads(message)
+
+            handler = HANDLERS.get(data.get("type", ""))
+            if handler:
+                await handler(data.get("data", {}))
 
         except (websockets.ConnectionClosed, websockets.exceptions.ConnectionClosedError):
             logger.warning("WebSocket connection closed. Reconnecting in 3s...")
@@ -169,7 +196,7 @@ async def on_message(message: cl.Message):
 
     try:
         ws = await _get_ws()
-        await ws.send(json.dumps({
+        await ws.send(json_dumps({
             "type": "command",
             "data": {"text": text},
         }))
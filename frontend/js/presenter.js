@@ -39,6 +39,7 @@
         if (ws && ws.readyState === WebSocket.OPEN) return;
 
         ws = new WebSocket(WS_URL);
+        ws.binaryType = 'arraybuffer';
 
         ws.onopen = function () {
             console.log('[Presenter] Connected to backend.');
@@ -46,6 +47,10 @@
         };
 
         ws.onmessage = function (event) {
+            if (event.data instanceof ArrayBuffer) {
+                handleAudioFrame(event.data);
+                return;
+            }
             try {
                 const data = JSON.parse(event.data);
                 handleMessage(data);
@@ -301,6 +306,28 @@
         }
     }
 
+    // Binary audio frames: 1-byte type, 4-byte big-endian index, then raw MP3 bytes.
+    var AUDIO_FRAME_CHUNK = 0x01;
+    var AUDIO_FRAME_FINAL = 0x02;
+    var AUDIO_FRAME_HEADER = 5;
+
+    function handleAudioFrame(buffer) {
+        if (!isStreaming || buffer.byteLength < AUDIO_FRAME_HEADER) return;
+
+        var frameType = new Uint8Array(buffer, 0, 1)[0];
+
+        if (frameType === AUDIO_FRAME_FINAL) {
+            console.log('[Presenter] Stream complete. Assembling ' + streamBuffer.length + ' chunks...');
+            isStreaming = false;
+            assembleAndPlayStream();
+            return;
+        }
+
+        if (frameType === AUDIO_FRAME_CHUNK && buffer.byteLength > AUDIO_FRAME_HEADER) {
+            streamBuffer.push(new Uint8Array(buffer, AUDIO_FRAME_HEADER));
+        }
+    }
+
     function assembleAndPlayStream() {
         if (streamBuffer.length === 0) {
             console.warn('[Presenter] Empty stream buffer.');
@@ -0,0 +1,86 @@
+"""Shared test setup.
+
+langgraph is only needed for its type helpers in backend.agent.states, so
+when it is not installed a mock stands in for it. This runs once, before
+any test module imports backend.agent.
+
+Also provides a lightweight fake of the TTS HTTP client (fake_tts_client).
+"""
+
+import sys
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+try:
+    import langgraph.graph  # noqa: F401
+except ImportError:
+    langgraph_mock = MagicMock()
+    langgraph_mock.add_messages = lambda x, y: x + y
+    sys.modules["langgraph"] = langgraph_mock
+    sys.modules["langgraph.graph"] = langgraph_mock
+
+
+class FakeStreamResponse:
+    """Minimal stand-in for a successful streamed httpx.Response.
+
+    An exception in ``chunks`` is raised at that point of the body, to
+    simulate a stream cut off mid-transfer.
+    """
+
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+        self.status_code = 200
+        self.is_error = False
+
+    def raise_for_status(self):
+        pass
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+class FakeTTSClient:
+    """Stand-in for the shared httpx.AsyncClient used by tts_service.
+
+    ``stream()`` serves ``chunks`` and records each request in ``requests``.
+    Setting ``status_code`` to an error makes ``stream()`` yield a real, unread
+    httpx.Response with that status instead, as httpx does for a failed stream.
+    """
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.status_code = 200
+        self.requests: list[tuple] = []
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if self.status_code >= 400:
+            yield httpx.Response(
+                self.status_code,
+                request=httpx.Request(method, url),
+                stream=httpx.ByteStream(b'{"detail": "unavailable"}'),
+            )
+        else:
+            yield FakeStreamResponse(self.chunks)
+
+
+@pytest.fixture
+def fake_tts_client(monkeypatch):
+    """Route tts_service HTTP calls to a FakeTTSClient serving b"fake_audio_bytes"."""
+    from backend.services import tts_service
+
+    client = FakeTTSClient([b"fake_audio", b"_bytes"])
+
+    async def get_client():
+        return client
+
+    monkeypatch.setattr(tts_service, "_get_client", get_client)
+    monkeypatch.setattr(tts_service, "_get_voice_id", lambda: "test_voice")
+    return client
@@ -1,21 +1,23 @@
 """Tests for the audio pipeline — TTS service, manifest, and batch generation."""
 
 import asyncio
+import base64
 import json
 import os
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import yaml
 
 # --- Kokoro batch generate tests ---
 
-from tools.kokoro_batch_generate import collect_audio_jobs, export_text_files
+from tools.kokoro_batch_generate import collect_audio_jobs, export_text_files, update_manifest
 
 
-SAMPLE_CONFIG = {
+# Read-only so tests sharing the fixtures below can't mutate it under each other
+SAMPLE_CONFIG = MappingProxyType({
     "presentation": {
         "title": "Test Presentation",
         "total_slides": 3,
@@ -48,25 +50,28 @@ SAMPLE_CONFIG = {
             },
         },
     ],
-}
+})
+
+
+@pytest.fixture(scope="module")
+def sample_jobs():
+    """Jobs for SAMPLE_CONFIG, computed once per module."""
+    return collect_audio_jobs(SAMPLE_CONFIG)
 
 
 class TestCollectAudioJobs:
     """Test audio job extraction from config."""
 
-    def test_collects_narration_jobs(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        narration_jobs = [j for j in jobs if j["label"].endswith("_narration")]
+    def test_collects_narration_jobs(self, sample_jobs):
+        narration_jobs = [j for j in sample_jobs if j["label"].endswith("_narration")]
         assert len(narration_jobs) == 2  # Slides 1 and 2 have narration
 
-    def test_collects_interaction_jobs(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        ask_jobs = [j for j in jobs if j["label"].endswith("_ask")]
+    def test_collects_interaction_jobs(self, sample_jobs):
+        ask_jobs = [j for j in sample_jobs if j["label"].endswith("_ask")]
         assert len(ask_jobs) == 1  # Only slide 2 has interaction
 
-    def test_skips_slides_without_narration(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        slide_ids = [j["slide_id"] for j in jobs]
+    def test_skips_slides_without_narration(self, sample_jobs):
+        slide_ids = [j["slide_id"] for j in sample_jobs]
         assert 0 not in slide_ids  # Title slide has no narration
 
     def test_slide_filter(self):
@@ -82,155 +87,400 @@ class TestCollectAudioJobs:
         jobs = collect_audio_jobs(SAMPLE_CONFIG, slide_filter=[99])
         assert len(jobs) == 0
 
-    def test_job_structure(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        job = jobs[0]
+    def test_job_structure(self, sample_jobs):
+        job = sample_jobs[0]
         assert "slide_id" in job
         assert "title" in job
         assert "label" in job
         assert "text" in job
         assert "audio_filename" in job
+        assert job["text_bytes"] == job["text"].encode("utf-8")
 
-    def test_text_is_stripped(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        for job in jobs:
+    def test_text_is_stripped(self, sample_jobs):
+        for job in sample_jobs:
             assert job["text"] == job["text"].strip()
 
-    def test_audio_filename_is_basename(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
-        for job in jobs:
+    def test_audio_filename_is_basename(self, sample_jobs):
+        for job in sample_jobs:
             assert "/" not in job["audio_filename"]
             assert "\\" not in job["audio_filename"]
 
+    def test_windows_style_audio_path(self):
+        config = {"slides": [{"id": 3, "narration": "Hi.", "audio_file": "audio\\slide_03.mp3"}]}
+        assert collect_audio_jobs(config)[0]["audio_filename"] == "slide_03.mp3"
+
 
 class TestExportTextFiles:
     """Test text file export for manual Kokoro generation."""
 
-    def test_creates_text_files(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
+    def test_creates_text_files(self, sample_jobs):
         with tempfile.TemporaryDirectory() as tmpdir:
-            export_text_files(jobs, Path(tmpdir))
+            export_text_files(sample_jobs, Path(tmpdir))
 
             # Check that .txt files were created
             txt_files = list(Path(tmpdir).glob("*.txt"))
-            # jobs count + README.txt
-            assert len(txt_files) == len(jobs) + 1
+            # one file per job + README.txt
+            assert len(txt_files) == len(sample_jobs) + 1
 
-    def test_text_content_matches(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
+    def test_text_content_matches(self, sample_jobs):
         with tempfile.TemporaryDirectory() as tmpdir:
-            export_text_files(jobs, Path(tmpdir))
+            export_text_files(sample_jobs, Path(tmpdir))
 
-            for job in jobs:
+            for job in sample_jobs:
                 txt_name = job["audio_filename"].replace(".mp3", ".txt")
                 txt_path = Path(tmpdir) / txt_name
                 assert txt_path.exists()
                 content = txt_path.read_text(encoding="utf-8")
                 assert content == job["text"]
 
-    def test_creates_readme(self):
-        jobs = collect_audio_jobs(SAMPLE_CONFIG)
+    def test_creates_readme(self, sample_jobs):
         with tempfile.TemporaryDirectory() as tmpdir:
-            export_text_files(jobs, Path(tmpdir))
+            export_text_files(sample_jobs, Path(tmpdir))
             readme = Path(tmpdir) / "README.txt"
             assert readme.exists()
             content = readme.read_text(encoding="utf-8")
             assert "Kokoro TTS" in content
 
 
+class TestGenerateAudio:
+    """Test Kokoro REST generation against a mock transport."""
+
+    @staticmethod
+    async def _generate(handler, output_path, monkeypatch):
+        import httpx
+        from tools import kokoro_batch_generate
+
+        monkeypatch.setattr(kokoro_batch_generate, "_sleep", AsyncMock())
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await kokoro_batch_generate.generate_audio(client, "Hello", output_path)
+
+    @pytest.mark.asyncio
+    async def test_streams_to_file_after_retry(self, monkeypatch):
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(json.loads(request.content))
+            if len(calls) == 1:
+                return httpx.Response(503, text="busy")
+            return httpx.Response(200, content=b"ID3" + b"\x00" * 1000)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "slide_01.mp3")
+            assert await self._generate(handler, output_path, monkeypatch) == 1003
+            assert Path(output_path).read_bytes() == b"ID3" + b"\x00" * 1000
+            assert os.listdir(tmpdir) == ["slide_01.mp3"]
+            assert len(calls) == 2 and calls[0]["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, monkeypatch):
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadError("connection reset", request=request)
+            return httpx.Response(400, text="bad voice")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "slide_01.mp3")
+            assert await self._generate(handler, output_path, monkeypatch) is None
+            assert len(calls) == 2
+            assert os.listdir(tmpdir) == []
+
+
+class TestUpdateManifest:
+    """Test the batch generator's manifest bookkeeping."""
+
+    def test_records_generated_and_missing(self, sample_jobs):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_dir = Path(tmpdir)
+            (audio_dir / "slide_01_intro.mp3").write_bytes(b"intro")
+            update_manifest(audio_dir, sample_jobs, {"slide_01_intro.mp3": "generated"})
+
+            manifest = json.loads((audio_dir / "audio_manifest.json").read_text(encoding="utf-8"))
+            assert manifest["slide_01_intro.mp3"]["exists"] is True
+            assert manifest["slide_01_intro.mp3"]["source"] == "kokoro-batch"
+            assert manifest["slide_02_main.mp3"]["exists"] is False
+
+    def test_unchanged_manifest_is_not_rewritten(self, sample_jobs):
+        from tools import kokoro_batch_generate
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_dir = Path(tmpdir)
+            update_manifest(audio_dir, sample_jobs, {})
+            with patch.object(kokoro_batch_generate, "write_json_atomic") as write:
+                update_manifest(audio_dir, sample_jobs, {})
+            write.assert_not_called()
+
+
 # --- Audio manifest tests ---
 
 from tools.audio_manifest import get_expected_files, get_audio_file_info
 
 
+@pytest.fixture(scope="module")
+def sample_expected():
+    """Expected audio files for SAMPLE_CONFIG, computed once per module."""
+    return get_expected_files(SAMPLE_CONFIG)[0]
+
+
 class TestGetExpectedFiles:
     """Test expected file extraction from config."""
 
-    def test_extracts_narration_files(self):
-        expected = get_expected_files(SAMPLE_CONFIG)
-        narration = [e for e in expected if e["type"] == "narration"]
+    def test_extracts_narration_files(self, sample_expected):
+        narration = [e for e in sample_expected if e["type"] == "narration"]
         assert len(narration) == 2
 
-    def test_extracts_interaction_files(self):
-        expected = get_expected_files(SAMPLE_CONFIG)
-        interaction = [e for e in expected if e["type"] == "interaction"]
+    def test_extracts_interaction_files(self, sample_expected):
+        interaction = [e for e in sample_expected if e["type"] == "interaction"]
         assert len(interaction) == 1
 
-    def test_file_structure(self):
-        expected = get_expected_files(SAMPLE_CONFIG)
-        for item in expected:
+    def test_file_structure(self, sample_expected):
+        for item in sample_expected:
             assert "filename" in item
             assert "slide_id" in item
             assert "title" in item
             assert "type" in item
             assert "text_chars" in item
 
-    def test_text_chars_count(self):
-        expected = get_expected_files(SAMPLE_CONFIG)
-        intro = [e for e in expected if e["slide_id"] == 1 and e["type"] == "narration"][0]
+    def test_text_chars_count(self, sample_expected):
+        intro = [e for e in sample_expected if e["slide_id"] == 1 and e["type"] == "narration"][0]
         assert intro["text_chars"] == len("Hello everyone, welcome to the presentation.")
 
+    def test_expected_names_match_entries(self, sample_expected):
+        _, names = get_expected_files(SAMPLE_CONFIG)
+        assert names == {e["filename"] for e in sample_expected}
 
-# --- TTS service tests (mocked) ---
 
-class TestTTSService:
-    """Test TTS service functions with mocked HTTP calls."""
+class TestScanAndUpdate:
+    """Test manifest scanning against an audio directory."""
 
-    def test_synthesize_speech_success(self):
-        async def _run():
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.content = b"fake_audio_bytes"
-            mock_response.raise_for_status = MagicMock()
+    def test_unchanged_files_are_not_reprobed(self):
+        from tools import audio_manifest
 
-            with patch("backend.services.tts_service._get_api_key", return_value="test_key"), \
-                 patch("backend.services.tts_service._get_voice_id", return_value="test_voice"), \
-                 patch("httpx.AsyncClient") as mock_client_cls:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_dir = Path(tmpdir)
+            (audio_dir / "slide_01_intro.mp3").write_bytes(b"intro")
+            (audio_dir / "slide_02_main.mp3").write_bytes(b"main")
+
+            probe = MagicMock(return_value={"duration_seconds": 1.5})
+            with patch.object(audio_manifest, "_probe_audio", probe):
+                manifest = audio_manifest.scan_and_update(audio_dir, *get_expected_files(SAMPLE_CONFIG))
+                assert probe.call_count == 2
+                assert manifest["slide_01_intro.mp3"]["duration_seconds"] == 1.5
+                assert manifest["ask_02_maria.mp3"]["exists"] is False
+
+                probe.reset_mock()
+                (audio_dir / "slide_02_main.mp3").write_bytes(b"main, re-recorded")
+                manifest = audio_manifest.scan_and_update(audio_dir, *get_expected_files(SAMPLE_CONFIG))
+                assert [c.args[0].name for c in probe.call_args_list] == ["slide_02_main.mp3"]
+                assert manifest["slide_01_intro.mp3"]["duration_seconds"] == 1.5
+
+    def test_probe_media_false_reads_no_audio(self):
+        from tools import audio_manifest
 
-                mock_client = AsyncMock()
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=False)
-                mock_client.post = AsyncMock(return_value=mock_response)
-                mock_client_cls.return_value = mock_client
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_dir = Path(tmpdir)
+            (audio_dir / "slide_01_intro.mp3").write_bytes(b"intro")
 
-                from backend.services.tts_service import synthesize_speech
-                result = await synthesize_speech("Hello world")
+            probe = MagicMock(return_value={"duration_seconds": 1.5})
+            with patch.object(audio_manifest, "_probe_audio", probe):
+                manifest = audio_manifest.scan_and_update(
+                    audio_dir, *get_expected_files(SAMPLE_CONFIG), probe_media=False,
+                )
+            probe.assert_not_called()
+            assert manifest["slide_01_intro.mp3"]["exists"] is True
+            assert manifest["slide_01_intro.mp3"]["size_bytes"] == len(b"intro")
+            assert "duration_seconds" not in manifest["slide_01_intro.mp3"]
 
-                assert result == b"fake_audio_bytes"
-                mock_client.post.assert_called_once()
 
-        asyncio.run(_run())
+# --- TTS service tests (mocked) ---
 
-    def test_synthesize_speech_saves_to_file(self):
-        async def _run():
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.content = b"fake_audio_bytes"
-            mock_response.raise_for_status = MagicMock()
+class TestTTSService:
+    """Test TTS service functions with mocked HTTP calls."""
+
+    @pytest.mark.asyncio
+    async def test_synthesize_speech_success(self, fake_tts_client):
+        from backend.services.tts_service import synthesize_speech
 
-            with patch("backend.services.tts_service._get_api_key", return_value="test_key"), \
-                 patch("backend.services.tts_service._get_voice_id", return_value="test_voice"), \
-                 patch("httpx.AsyncClient") as mock_client_cls:
+        result = await synthesize_speech("Hello world")
 
-                mock_client = AsyncMock()
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=False)
-                mock_client.post = AsyncMock(return_value=mock_response)
-                mock_client_cls.return_value = mock_client
+        assert result == b"fake_audio_bytes"
+        assert len(fake_tts_client.requests) == 1
 
-                from backend.services.tts_service import synthesize_speech
+    @pytest.mark.asyncio
+    async def test_synthesize_speech_saves_to_file(self, fake_tts_client):
+        from backend.services.tts_service import synthesize_speech
 
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                    output_path = f.name
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            output_path = f.name
 
-                try:
-                    await synthesize_speech("Hello world", output_path=output_path)
-                    assert Path(output_path).exists()
-                    assert Path(output_path).read_bytes() == b"fake_audio_bytes"
-                finally:
-                    os.unlink(output_path)
+        try:
+            result = await synthesize_speech("Hello world", output_path=output_path)
+            assert result == b"fake_audio_bytes"
+            assert Path(output_path).exists()
+            assert Path(output_path).read_bytes() == b"fake_audio_bytes"
+            assert len(fake_tts_client.requests) == 1
+        finally:
+            os.unlink(output_path)
 
-        asyncio.run(_run())
+    @pytest.mark.asyncio
+    async def test_failed_stream_leaves_no_file(self, fake_tts_client, monkeypatch):
+        import httpx
+        from backend.services import tts_service
+        from backend.services.tts_service import synthesize_speech
+
+        # The failure counts toward the circuit breaker; restore it afterwards
+        monkeypatch.setitem(tts_service._breaker, "failures", 0)
+        fake_tts_client.chunks = [b"partial", httpx.ReadError("connection reset")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "answer.mp3")
+            with pytest.raises(httpx.ReadError):
+                await synthesize_speech("Hello world", output_path=output_path, max_retries=0)
+            assert os.listdir(tmpdir) == []
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_until_closed(self):
+        from backend.services import tts_service
+
+        with patch("backend.services.tts_service._get_api_key", return_value="test_key"), \
+             patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = MagicMock()
+            mock_client.is_closed = False
+            mock_client.aclose = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            tts_service._client = None
+            first = await tts_service._get_client()
+            second = await tts_service._get_client()
+            assert first is second
+            mock_client_cls.assert_called_once()
+
+            await tts_service.close_client()
+            mock_client.aclose.assert_awaited_once()
+            assert tts_service._client is None
+
+    @pytest.mark.asyncio
+    async def test_client_falls_back_to_http1_without_h2(self, monkeypatch):
+        from backend.services import tts_service
+
+        client_cls = MagicMock()
+        monkeypatch.setattr(tts_service.httpx, "AsyncClient", client_cls)
+        monkeypatch.setattr(tts_service, "_HTTP2_AVAILABLE", False)
+        monkeypatch.setattr(tts_service, "_get_api_key", lambda: "test_key")
+        monkeypatch.setattr(tts_service, "_client", None)
+
+        await tts_service._get_client()
+        assert client_cls.call_args.kwargs["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_credits_are_cached(self):
+        from backend.services import tts_service
+
+        fetch = AsyncMock(return_value=1234)
+        tts_service.invalidate_cache()
+        with patch("backend.services.tts_service._fetch_remaining_credits", fetch):
+            assert await tts_service.get_remaining_credits() == 1234
+            assert await tts_service.get_remaining_credits() == 1234
+            fetch.assert_awaited_once()
+
+            tts_service.invalidate_cache("credits")
+            await tts_service.get_remaining_credits()
+            assert fetch.await_count == 2
+        tts_service.invalidate_cache()
+
+    @pytest.mark.asyncio
+    async def test_status_skips_credits_when_unconfigured(self):
+        from backend.services import tts_service
+
+        fetch = AsyncMock(return_value=1234)
+        with patch.object(tts_service, "is_configured", return_value=False), \
+                patch.object(tts_service, "get_remaining_credits", fetch):
+            assert await tts_service.get_status() == {"configured": False, "credits": None}
+            fetch.assert_not_awaited()
+
+        with patch.object(tts_service, "is_configured", return_value=True), \
+                patch.object(tts_service, "get_remaining_credits", fetch):
+            assert await tts_service.get_status() == {"configured": True, "credits": 1234}
+
+    def test_retry_after_parsing(self):
+        from backend.services.tts_service import _retry_after_seconds
+
+        def resp(value):
+            r = MagicMock()
+            r.headers = {"Retry-After": value} if value is not None else {}
+            return r
+
+        assert _retry_after_seconds(resp("3")) == 3.0
+        assert _retry_after_seconds(resp(None)) is None
+        assert _retry_after_seconds(resp("not a date")) is None
+        # An HTTP-date in the past means "retry now"
+        assert _retry_after_seconds(resp("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_is_not_waited_out(self, monkeypatch):
+        import httpx
+        from backend.services import tts_service
+
+        request = httpx.Request("POST", "https://x")
+        response = httpx.Response(429, headers={"Retry-After": "3600"}, request=request)
+        error = httpx.HTTPStatusError("rate limited", request=request, response=response)
+
+        sleep = AsyncMock()
+        monkeypatch.setitem(tts_service._breaker, "failures", 0)
+        monkeypatch.setattr(tts_service, "_get_client", AsyncMock())
+        monkeypatch.setattr(tts_service, "_stream_audio", AsyncMock(side_effect=error))
+        monkeypatch.setattr(tts_service, "_sleep", sleep)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await tts_service.synthesize_speech("Hello")
+        sleep.assert_not_awaited()
+
+    @staticmethod
+    async def _synthesize(tts_service):
+        # No retries: each call is exactly one breaker outcome
+        return await tts_service.synthesize_speech("Hello", max_retries=0)
+
+    @staticmethod
+    async def _stream(tts_service):
+        return b"".join([chunk async for chunk in tts_service.stream_speech("Hello")])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call", ["_synthesize", "_stream"])
+    async def test_circuit_breaker_opens_and_recovers(self, call, fake_tts_client, monkeypatch):
+        import httpx
+        from backend.services import tts_service
+
+        call = getattr(self, call)
+        monkeypatch.setitem(tts_service._breaker, "failures", 0)
+        monkeypatch.setitem(tts_service._breaker, "opened_at", 0.0)
+
+        # Client errors are the caller's fault, not a degraded API
+        fake_tts_client.status_code = 400
+        with pytest.raises(httpx.HTTPStatusError):
+            await call(tts_service)
+        assert tts_service._breaker["failures"] == 0
+
+        fake_tts_client.status_code = 503
+        for failures in range(1, tts_service.BREAKER_THRESHOLD + 1):
+            with pytest.raises(httpx.HTTPStatusError):
+                await call(tts_service)
+            assert tts_service._breaker["failures"] == failures
+
+        requests_sent = len(fake_tts_client.requests)
+        with pytest.raises(RuntimeError, match="circuit open"):
+            await call(tts_service)
+        assert len(fake_tts_client.requests) == requests_sent
+
+        # After the cooldown one probe goes through; success closes the circuit
+        fake_tts_client.status_code = 200
+        tts_service._breaker["opened_at"] -= tts_service.BREAKER_COOLDOWN
+        assert await call(tts_service) == b"fake_audio_bytes"
+        assert tts_service._breaker["failures"] == 0
 
     def test_is_configured_true(self):
         with patch.dict(os.environ, {
@@ -250,28 +500,92 @@ class TestTTSService:
 
 
 class TestTTSStreamBase64:
-    """Test the base64 streaming wrapper."""
-
-    def test_stream_yields_chunks_and_final(self):
-        async def _run():
-            async def mock_stream(*args, **kwargs):
-                yield b"chunk1"
-                yield b"chunk2"
-
-            with patch("backend.services.tts_service.stream_speech", side_effect=mock_stream):
-                from backend.services.tts_service import stream_speech_as_base64
-
-                chunks = []
-                async for msg in stream_speech_as_base64("test"):
-                    chunks.append(msg)
-
-                # 2 data chunks + 1 final marker
-                assert len(chunks) == 3
-                assert chunks[0]["type"] == "audio_chunk"
-                assert chunks[0]["data"]["index"] == 0
-                assert chunks[0]["data"]["final"] is False
-                assert chunks[1]["data"]["index"] == 1
-                assert chunks[2]["data"]["final"] is True
-                assert chunks[2]["data"]["chunk"] == ""
-
-        asyncio.run(_run())
+    """Test the base64 / binary streaming wrappers."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_and_final(self):
+        async def mock_stream(*args, **kwargs):
+            yield b"chunk1"
+            yield b"chunk2"
+
+        with patch("backend.services.tts_service.stream_speech", side_effect=mock_stream):
+            from backend.services.tts_service import stream_speech_as_base64
+
+            chunks = []
+            async for msg in stream_speech_as_base64("test", min_chunk_bytes=1):
+                chunks.append(msg)
+
+            # 2 data chunks + 1 final marker
+            assert len(chunks) == 3
+            assert chunks[0]["type"] == "audio_chunk"
+            assert chunks[0]["data"]["index"] == 0
+            assert chunks[0]["data"]["final"] is False
+            assert chunks[1]["data"]["index"] == 1
+            assert chunks[2]["data"]["final"] is True
+            assert chunks[2]["data"]["chunk"] == ""
+
+    @pytest.mark.asyncio
+    async def test_stream_coalesces_small_chunks(self):
+        async def mock_stream(*args, **kwargs):
+            yield b"chunk1"
+            yield b"chunk2"
+
+        with patch("backend.services.tts_service.stream_speech", side_effect=mock_stream):
+            from backend.services.tts_service import stream_speech_as_base64
+
+            chunks = []
+            async for msg in stream_speech_as_base64("test", max_delay_ms=60_000):
+                chunks.append(msg)
+
+            # Both chunks merged into one data message + 1 final marker
+            assert len(chunks) == 2
+            assert base64.b64decode(chunks[0]["data"]["chunk"]) == b"chunk1chunk2"
+            assert chunks[1]["data"]["final"] is True
+            assert chunks[1]["data"]["index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_binary_stream_frames(self):
+        async def mock_stream(*args, **kwargs):
+            yield b"chunk1"
+            yield b"chunk2"
+
+        with patch("backend.services.tts_service.stream_speech", side_effect=mock_stream):
+            from backend.services.tts_service import stream_speech_as_binary
+
+            frames = [f async for f in stream_speech_as_binary("test", min_chunk_bytes=1)]
+
+            assert frames == [
+                b"\x01\x00\x00\x00\x00chunk1",
+                b"\x01\x00\x00\x00\x01chunk2",
+                b"\x02\x00\x00\x00\x02",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_preserves_order_and_closes(self):
+        from backend.services.tts_service import _prefetch
+
+        closed = []
+
+        async def source():
+            try:
+                for i in range(3):
+                    yield bytes([i])
+            finally:
+                closed.append(True)
+
+        items = [item async for item in _prefetch(source())]
+        assert items == [b"\x00", b"\x01", b"\x02"]
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_large_blocks_encoded_off_loop(self):
+        from backend.services import tts_service
+
+        small = b"x" * 10
+        large = b"y" * (tts_service.B64_OFFLOAD_BYTES + 1)
+        with patch.object(asyncio.get_running_loop(), "run_in_executor",
+                          wraps=asyncio.get_running_loop().run_in_executor) as spy:
+            assert await tts_service._b64encode_block(small) == base64.b64encode(small)
+            spy.assert_not_called()
+            assert await tts_service._b64encode_block(large) == base64.b64encode(large)
+            spy.assert_called_once()
@@ -6,6 +6,8 @@ without requiring the full langgraph dependency.
 
 import pytest
 
+# langgraph is mocked in conftest.py when it is not installed
+from backend.agent.actions import asking_node, decide_next_state, route_next_command
 from backend.models.presentation import AgentState, AudioType
 
 
@@ -33,25 +35,6 @@ def create_initial_state(total_slides: int = 15) -> dict:
     }
 
 
-# Import actions after defining the test helper to avoid langgraph import at module level
-try:
-    from backend.agent.actions import asking_node, decide_next_state, route_next_command
-except ImportError:
-    # If langgraph is not installed, define minimal stubs for the routing functions
-    # that mirror the logic in actions.py without the langgraph type hints
-    import importlib
-    import sys
-    from unittest.mock import MagicMock
-
-    # Mock langgraph so the import chain works
-    langgraph_mock = MagicMock()
-    sys.modules["langgraph"] = langgraph_mock
-    sys.modules["langgraph.graph"] = langgraph_mock
-    langgraph_mock.add_messages = lambda x, y: x + y
-
-    from backend.agent.actions import asking_node, decide_next_state, route_next_command
-
-
 class TestInitialState:
     """Test initial state creation."""
 
@@ -0,0 +1,31 @@
+"""Helpers shared by the audio tools.
+
+audio_manifest.py and kokoro_batch_generate.py both parse the presentation
+config, derive audio filenames from it, and read/write audio_manifest.json;
+they use these so the two tools always agree.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from backend.utils import json_dumps_indented, yaml_load
+
+
+@lru_cache(maxsize=8)
+def load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up."""
+    with open(path, "rb") as f:
+        return yaml_load(f)
+
+
+def config_basename(path: str) -> str:
+    """Final component of a config path, accepting either separator."""
+    return path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+
+
+def write_json_atomic(path: Path, data: dict):
+    """Write JSON to a temp file next to path, then swap it in with os.replace."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(json_dumps_indented(data))
+    os.replace(tmp_path, path)
@@ -7,25 +7,73 @@ Usage:
     python tools/audio_manifest.py                  # Scan and update manifest
     python tools/audio_manifest.py --report         # Print a summary report
     python tools/audio_manifest.py --missing-only   # Show only missing files
+    python tools/audio_manifest.py --with-loudness  # Also measure loudness (slow)
 """
 
 import argparse
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 
-import yaml
+# Add project root to path so the tools can share helpers
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils import json_loads  # noqa: E402
+from tools._common import (  # noqa: E402
+    config_basename,
+    load_yaml_cached,
+    write_json_atomic,
+)
+
+# Optional audio readers, resolved once rather than on every probed file
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
 
 
 def load_presentation_config(config_path: Path) -> dict:
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load presentation configuration from YAML.
+
+    Repeated loads of an unchanged file return the same cached dict; treat it
+    as read-only.
+    """
+    return load_yaml_cached(str(config_path), os.stat(config_path).st_mtime_ns)
+
+
+# (config, expected files, expected names) from the last get_expected_files()
+# call. The config is held strongly and compared by identity, so a recycled
+# id() can never hit.
+_expected_memo: tuple[dict, list[dict], frozenset[str]] | None = None
+
+
+def get_expected_files(config: dict) -> tuple[list[dict], frozenset[str]]:
+    """Get all expected audio files from the presentation config.
 
+    Returns the expected entries along with the set of their filenames, both
+    built in one pass over the slides. Repeated calls with the same (cached,
+    read-only) config object return the same objects; treat them as read-only.
+    """
+    global _expected_memo
+    if _expected_memo is not None and _expected_memo[0] is config:
+        return _expected_memo[1], _expected_memo[2]
+    expected, names = _collect_expected_files(config)
+    _expected_memo = (config, expected, names)
+    return expected, names
 
-def get_expected_files(config: dict) -> list[dict]:
-    """Get all expected audio files from the presentation config."""
+
+def _collect_expected_files(config: dict) -> tuple[list[dict], frozenset[str]]:
     expected = []
+    names = set()
     for slide in config.get("slides", []):
         slide_id = slide.get("id", -1)
         title = slide.get("title", "Untitled")
@@ -33,8 +81,10 @@ def get_expected_files(config: dict) -> list[dict]:
         narration = slide.get("narration")
 
         if audio_file:
+            filename = config_basename(audio_file)
+            names.add(filename)
             expected.append({
-                "filename": Path(audio_file).name,
+                "filename": filename,
                 "slide_id": slide_id,
                 "title": title,
                 "type": "narration",
@@ -46,54 +96,135 @@ def get_expected_files(config: dict) -> list[dict]:
             q_audio = interaction.get("question_audio")
             q_text = interaction.get("question", "")
             if q_audio:
+                filename = config_basename(q_audio)
+                names.add(filename)
                 expected.append({
-                    "filename": Path(q_audio).name,
+                    "filename": filename,
                     "slide_id": slide_id,
                     "title": f"{title} — Interaction Q",
                     "type": "interaction",
                     "text_chars": len(q_text.strip()) if q_text else 0,
                 })
 
-    return expected
+    return expected, frozenset(names)
 
 
-def get_audio_file_info(file_path: Path) -> dict | None:
-    """Get metadata for an audio file (duration, size)."""
-    if not file_path.exists():
-        return None
+def _probe_audio(file_path: Path, with_loudness: bool = False) -> dict:
+    """Read an audio file's duration, and its loudness if asked.
 
-    info = {
-        "size_bytes": file_path.stat().st_size,
-        "size_kb": round(file_path.stat().st_size / 1024, 1),
-        "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-    }
+    Duration comes from the file headers via mutagen (no decoding). Loudness
+    needs the samples, so it — or duration, when mutagen is missing or can't
+    read the file — falls back to a full pydub decode. Returns {} if neither
+    works.
+    """
+    if not with_loudness and mutagen is not None:
+        try:
+            meta = mutagen.File(str(file_path))
+            if meta is not None and meta.info is not None:
+                return {"duration_seconds": round(meta.info.length, 1)}
+        except Exception:
+            pass
 
-    # Try to get duration via pydub
+    if AudioSegment is None:
+        return {}
     try:
-        from pydub import AudioSegment
         audio = AudioSegment.from_file(str(file_path))
-        info["duration_seconds"] = round(len(audio) / 1000.0, 1)
-        info["loudness_db"] = round(audio.dBFS, 1)
+        return {
+            "duration_seconds": round(len(audio) / 1000.0, 1),
+            "loudness_db": round(audio.dBFS, 1),
+        }
     except Exception:
-        pass
+        return {}
+
+
+def get_audio_file_info(file_path: Path, stat: os.stat_result | None = None,
+                        probe: bool = True, with_loudness: bool = False) -> dict | None:
+    """Get metadata for an audio file (size, duration, optionally loudness).
+
+    Pass ``stat`` when it is already known (e.g. from os.scandir) to skip
+    the filesystem lookup, and ``probe=False`` to skip reading the audio
+    for duration and loudness.
+    """
+    if stat is None:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+
+    info = {
+        "size_bytes": stat.st_size,
+        "size_kb": round(stat.st_size / 1024, 1),
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+    if probe:
+        info.update(_probe_audio(file_path, with_loudness))
 
     return info
 
 
-def scan_and_update(audio_dir: Path, expected: list[dict]) -> dict:
-    """Scan audio directory and build/update the manifest."""
+def _scan_audio_dir(audio_dir: Path) -> dict[str, os.DirEntry]:
+    """List the files in audio_dir in one directory read (name -> DirEntry)."""
+    if not audio_dir.is_dir():
+        return {}
+    with os.scandir(audio_dir) as it:
+        return {entry.name: entry for entry in it if entry.is_file()}
+
+
+def scan_and_update(audio_dir: Path, expected: list[dict], expected_names: frozenset[str],
+                    with_loudness: bool = False, probe_media: bool = True) -> dict:
+    """Scan audio directory and build/update the manifest.
+
+    Loudness (loudness_db) needs a full decode of every file, so it is only
+    measured when ``with_loudness`` is set. With ``probe_media=False`` no
+    audio is read at all: new or changed files get stat info only (they are
+    probed on the next full scan) and unchanged files keep their cached probe.
+    """
     manifest_path = audio_dir / "audio_manifest.json"
+    entries = _scan_audio_dir(audio_dir)
 
-    # Load existing manifest
+    # Load existing manifest (its presence is already known from the scan)
     manifest = {}
-    if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
+    if manifest_path.name in entries:
+        manifest = json_loads(manifest_path.read_bytes())
+    # Entries are replaced, never mutated, so a shallow copy is enough to compare
+    original = dict(manifest)
+
+    extra_names = [
+        name for name in entries
+        if name.endswith(".mp3") and name not in expected_names and name not in manifest
+    ]
+
+    # Reuse the previous run's probe for files whose size and mtime are unchanged
+    probes: dict[str, dict] = {}
+    to_probe: list[str] = []
+    for name in [name for name in expected_names if name in entries] + extra_names:
+        previous = manifest.get(name, {})
+        stat = entries[name].stat()
+        if (
+            previous.get("size_bytes") == stat.st_size
+            and previous.get("mtime_ns") == stat.st_mtime_ns
+            and "duration_seconds" in previous
+            and (not with_loudness or "loudness_db" in previous)
+        ):
+            probes[name] = {
+                key: previous[key] for key in ("duration_seconds", "loudness_db") if key in previous
+            }
+        else:
+            to_probe.append(name)
+
+    # Probing can mean an ffmpeg decode, so probe the rest in parallel
+    if probe_media and to_probe:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            probes.update(zip(to_probe, pool.map(
+                lambda name: _probe_audio(audio_dir / name, with_loudness), to_probe,
+            )))
 
     # Update with expected files
     for item in expected:
         filename = item["filename"]
-        file_path = audio_dir / filename
+        dir_entry = entries.get(filename)
         existing = manifest.get(filename, {})
 
         entry = {
@@ -101,13 +232,16 @@ def scan_and_update(audio_dir: Path, expected: list[dict]) -> dict:
             "title": item["title"],
             "type": item["type"],
             "text_chars": item["text_chars"],
-            "exists": file_path.exists(),
+            "exists": dir_entry is not None,
             "source": existing.get("source", "unknown"),
             "last_updated": existing.get("last_updated"),
         }
 
         # Get file info if it exists
-        file_info = get_audio_file_info(file_path)
+        file_info = None
+        if dir_entry is not None:
+            file_info = get_audio_file_info(audio_dir / filename, dir_entry.stat(), probe=False)
+            file_info.update(probes.get(filename, {}))
         if file_info:
             entry.update(file_info)
             if entry["source"] == "unknown":
@@ -117,25 +251,23 @@ def scan_and_update(audio_dir: Path, expected: list[dict]) -> dict:
 
         manifest[filename] = entry
 
-    # Check for unexpected files in the audio directory
-    expected_names = {item["filename"] for item in expected}
-    if audio_dir.exists():
-        for f in audio_dir.glob("*.mp3"):
-            if f.name not in expected_names and f.name not in manifest:
-                file_info = get_audio_file_info(f) or {}
-                entry = {
-                    "slide_id": -1,
-                    "title": "Unknown / Extra file",
-                    "type": "unknown",
-                    "exists": True,
-                    "source": "unknown",
-                }
-                entry.update(file_info)
-                manifest[f.name] = entry
-
-    # Save manifest
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    # Record unexpected files in the audio directory
+    for name in extra_names:
+        file_info = get_audio_file_info(audio_dir / name, entries[name].stat(), probe=False)
+        file_info.update(probes.get(name, {}))
+        entry = {
+            "slide_id": -1,
+            "title": "Unknown / Extra file",
+            "type": "unknown",
+            "exists": True,
+            "source": "unknown",
+        }
+        entry.update(file_info)
+        manifest[name] = entry
+
+    # Save manifest (only if something changed)
+    if manifest != original:
+        write_json_atomic(manifest_path, manifest)
 
     return manifest
 
@@ -146,24 +278,25 @@ def print_report(manifest: dict, missing_only: bool = False):
     existing = sum(1 for v in manifest.values() if v.get("exists"))
     missing = total - existing
 
+    # Collected and written once at the end rather than one print() per line
+    lines: list[str] = []
+    add = lines.append
+
     if not missing_only:
-        print(f"\n{'='*60}")
-        print(f"  AUDIO MANIFEST REPORT")
-        print(f"{'='*60}")
-        print(f"  Total expected files: {total}")
-        print(f"  Existing:             {existing}")
-        print(f"  Missing:              {missing}")
-        print(f"{'='*60}\n")
-
-    # Group by slide
-    by_slide: dict[int, list] = {}
-    for filename, info in sorted(manifest.items(), key=lambda x: x[1].get("slide_id", 99)):
-        sid = info.get("slide_id", -1)
-        by_slide.setdefault(sid, []).append((filename, info))
-
-    for slide_id in sorted(by_slide.keys()):
-        items = by_slide[slide_id]
-        for filename, info in items:
+        add(f"\n{'='*60}")
+        add(f"  AUDIO MANIFEST REPORT")
+        add(f"{'='*60}")
+        add(f"  Total expected files: {total}")
+        add(f"  Existing:             {existing}")
+        add(f"  Missing:              {missing}")
+        add(f"{'='*60}\n")
+
+    # One stable sort by slide; entries without a slide_id (-1) come first
+    def slide_of(item: tuple[str, dict]) -> int:
+        return item[1].get("slide_id", -1)
+
+    for slide_id, group in groupby(sorted(manifest.items(), key=slide_of), key=slide_of):
+        for filename, info in group:
             exists = info.get("exists", False)
 
             if missing_only and exists:
@@ -175,14 +308,17 @@ def print_report(manifest: dict, missing_only: bool = False):
             source = info.get("source", "?")
             size = info.get("size_kb", "?")
 
-            print(f"{icon} Slide {slide_id:2d} | {filename:<35s} | {status} | {duration}s | {size}KB | src: {source}")
+            add(f"{icon} Slide {slide_id:2d} | {filename:<35s} | {status} | {duration}s | {size}KB | src: {source}")
 
     if missing > 0:
-        print(f"\n  {missing} file(s) missing. Generate with:")
-        print(f"    python tools/kokoro_batch_generate.py")
-        print(f"    python tools/kokoro_batch_generate.py --export-text")
+        add(f"\n  {missing} file(s) missing. Generate with:")
+        add(f"    python tools/kokoro_batch_generate.py")
+        add(f"    python tools/kokoro_batch_generate.py --export-text")
     elif not missing_only:
-        print(f"\n  All audio files present!")
+        add(f"\n  All audio files present!")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -191,9 +327,10 @@ def main():
     parser.add_argument("--audio-dir", default="frontend/audio/", help="Audio directory")
     parser.add_argument("--report", action="store_true", help="Print a summary report")
     parser.add_argument("--missing-only", action="store_true", help="Show only missing files")
+    parser.add_argument("--with-loudness", action="store_true",
+                        help="Also measure loudness (decodes every file; slower)")
     args = parser.parse_args()
 
-    project_root = Path(__file__).parent.parent
     config_path = project_root / args.config
     audio_dir = project_root / args.audio_dir
 
@@ -202,10 +339,14 @@ def main():
         sys.exit(1)
 
     config = load_presentation_config(config_path)
-    expected = get_expected_files(config)
+    expected, expected_names = get_expected_files(config)
 
     print(f"Scanning {audio_dir} against {len(expected)} expected files...")
-    manifest = scan_and_update(audio_dir, expected)
+    # --missing-only shows no durations, so don't read any audio for it
+    manifest = scan_and_update(
+        audio_dir, expected, expected_names,
+        with_loudness=args.with_loudness, probe_media=not args.missing_only,
+    )
 
     manifest_path = audio_dir / "audio_manifest.json"
     print(f"Manifest saved: {manifest_path}")
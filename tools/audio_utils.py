@@ -4,18 +4,48 @@ Format conversion, normalization, and validation for audio files.
 
 Usage:
     python tools/audio_utils.py --normalize frontend/audio/
+    python tools/audio_utils.py --normalize frontend/audio/ --jobs 4
     python tools/audio_utils.py --check frontend/audio/
 """
 
 import argparse
 import os
+import re
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+
+def _mean_volume_db(input_path: str) -> float:
+    """Measure an audio file's mean (RMS) volume in dBFS with ffmpeg's volumedetect."""
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", "-i", input_path, "-af", "volumedetect", "-f", "null", "-"],
+        capture_output=True, text=True, check=True,
+    )
+    match = re.search(r"mean_volume:\s*(\S+) dB", result.stderr)
+    if not match:
+        raise RuntimeError("ffmpeg volumedetect reported no mean_volume")
+    mean_db = float(match.group(1))
+    if mean_db == float("-inf"):
+        raise RuntimeError("file is silent, nothing to normalize")
+    return mean_db
+
 
 def normalize_audio(input_path: str, target_db: float = -20.0) -> bool:
     """Normalize audio file to a target dB level.
 
+    ffmpeg measures the current level and applies the gain itself, so the
+    samples never pass through Python. The result is written to a temporary
+    file next to the original and swapped in with os.replace, so an
+    interrupted run never leaves a truncated file behind.
+
     Args:
         input_path: Path to the audio file.
         target_db: Target loudness in dB (default -20.0).
@@ -23,18 +53,29 @@ def normalize_audio(input_path: str, target_db: float = -20.0) -> bool:
     Returns:
         True if normalization succeeded.
     """
+    path = Path(input_path)
+    tmp_path = path.with_name(f"{path.stem}.tmp{path.suffix}")
     try:
-        from pydub import AudioSegment
-
-        audio = AudioSegment.from_file(input_path)
-        change_in_db = target_db - audio.dBFS
-        normalized = audio.apply_gain(change_in_db)
-        normalized.export(input_path, format=Path(input_path).suffix.lstrip("."))
+        change_in_db = target_db - _mean_volume_db(input_path)
+        subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", input_path,
+             "-af", f"volume={change_in_db:.2f}dB", str(tmp_path)],
+            capture_output=True, text=True, check=True,
+        )
+        os.replace(tmp_path, path)
         print(f"  [OK] Normalized: {input_path} (adjusted {change_in_db:+.1f} dB)")
         return True
+    except FileNotFoundError:
+        print(f"  [ERROR] {input_path}: ffmpeg not found on PATH")
+        return False
+    except subprocess.CalledProcessError as e:
+        print(f"  [ERROR] {input_path}: ffmpeg failed: {e.stderr.strip()[-200:]}")
+        return False
     except Exception as e:
         print(f"  [ERROR] {input_path}: {e}")
         return False
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def check_audio_files(audio_dir: str) -> dict:
@@ -46,9 +87,7 @@ def check_audio_files(audio_dir: str) -> dict:
     Returns:
         Dict with counts of valid, invalid, and missing files.
     """
-    try:
-        from pydub import AudioSegment
-    except ImportError:
+    if AudioSegment is None:
         print("Error: pydub not installed. Run: pip install pydub")
         sys.exit(1)
 
@@ -59,11 +98,32 @@ def check_audio_files(audio_dir: str) -> dict:
         print(f"Directory not found: {audio_dir}")
         return results
 
-    for f in sorted(audio_path.glob("*.mp3")):
+    with os.scandir(audio_path) as it:
+        files = sorted(
+            (e for e in it if e.is_file() and e.name.endswith(".mp3")),
+            key=lambda e: e.name,
+        )
+
+    def probe(f: os.DirEntry) -> tuple[float, float] | Exception:
         try:
-            audio = AudioSegment.from_mp3(str(f))
-            duration = len(audio) / 1000.0
-            db = audio.dBFS
+            audio = AudioSegment.from_mp3(f.path)
+            return len(audio) / 1000.0, audio.dBFS
+        except Exception as e:
+            return e
+
+    # Decoding is mostly ffmpeg time, so run files in parallel; report in order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for f, outcome in zip(files, pool.map(probe, files)):
+            if isinstance(outcome, Exception):
+                results["invalid"] += 1
+                results["files"].append({
+                    "name": f.name,
+                    "status": f"ERROR: {outcome}",
+                })
+                print(f"  [ERROR] {f.name}: {outcome}")
+                continue
+
+            duration, db = outcome
             results["valid"] += 1
             results["files"].append({
                 "name": f.name,
@@ -72,13 +132,6 @@ def check_audio_files(audio_dir: str) -> dict:
                 "status": "OK",
             })
             print(f"  [OK] {f.name}: {duration:.1f}s, {db:.1f} dB")
-        except Exception as e:
-            results["invalid"] += 1
-            results["files"].append({
-                "name": f.name,
-                "status": f"ERROR: {e}",
-            })
-            print(f"  [ERROR] {f.name}: {e}")
 
     return results
 
@@ -97,9 +150,11 @@ def convert_wav_to_mp3(input_path: str, output_path: str = None, bitrate: str =
     if output_path is None:
         output_path = str(Path(input_path).with_suffix(".mp3"))
 
-    try:
-        from pydub import AudioSegment
+    if AudioSegment is None:
+        print("  [ERROR] Conversion failed: pydub not installed. Run: pip install pydub")
+        return False
 
+    try:
         audio = AudioSegment.from_wav(input_path)
         audio.export(output_path, format="mp3", bitrate=bitrate)
         print(f"  [OK] Converted: {input_path} → {output_path}")
@@ -115,6 +170,8 @@ def main():
     parser.add_argument("--check", metavar="DIR", help="Check all audio files in directory")
     parser.add_argument("--convert", metavar="FILE", help="Convert WAV to MP3")
     parser.add_argument("--target-db", type=float, default=-20.0, help="Target dB for normalization")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Files to normalize in parallel (default: CPU count)")
     args = parser.parse_args()
 
     if args.check:
@@ -124,9 +181,11 @@ def main():
 
     elif args.normalize:
         print(f"Normalizing audio files in: {args.normalize} (target: {args.target_db} dB)")
-        audio_dir = Path(args.normalize)
-        for f in sorted(audio_dir.glob("*.mp3")):
-            normalize_audio(str(f), args.target_db)
+        files = [str(f) for f in sorted(Path(args.normalize).glob("*.mp3"))]
+        # Each file is two ffmpeg runs with Python only waiting on them, so
+        # threads are enough to keep several going at once
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs or 1)) as pool:
+            list(pool.map(partial(normalize_audio, target_db=args.target_db), files))
 
     elif args.convert:
         convert_wav_to_mp3(args.convert)
@@ -47,7 +47,7 @@ async def generate(text: str, output_path: str, model: str | None = None):
 
 
 async def stream_test(text: str, output_path: str, model: str | None = None):
-    """Test streaming TTS and save the assembled output."""
+    """Test streaming TTS, writing the output as chunks arrive."""
     from backend.services.tts_service import stream_speech
 
     print(f"Streaming TTS for: {text[:100]}{'...' if len(text) > 100 else ''}")
@@ -55,23 +55,27 @@ async def stream_test(text: str, output_path: str, model: str | None = None):
     print()
 
     start = time.monotonic()
-    chunks = []
+    total_bytes = 0
     chunk_count = 0
 
-    async for chunk in stream_speech(text, model=model):
-        chunks.append(chunk)
-        chunk_count += 1
-        if chunk_count == 1:
-            ttfb = time.monotonic() - start
-            print(f"First chunk received in {ttfb:.2f}s")
+    # Write each chunk as it arrives instead of holding the whole stream. The
+    # part file only replaces output_path once the stream has completed.
+    part_path = output_path + ".part"
+    try:
+        with open(part_path, "wb") as f:
+            async for chunk in stream_speech(text, model=model):
+                f.write(chunk)
+                total_bytes += len(chunk)
+                chunk_count += 1
+                if chunk_count == 1:
+                    ttfb = time.monotonic() - start
+                    print(f"First chunk received in {ttfb:.2f}s")
+        os.replace(part_path, output_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
 
     elapsed = time.monotonic() - start
-    total_bytes = sum(len(c) for c in chunks)
-
-    # Save assembled audio
-    with open(output_path, "wb") as f:
-        for chunk in chunks:
-            f.write(chunk)
 
     print(f"Stream complete: {chunk_count} chunks, {total_bytes / 1024:.1f} KB in {elapsed:.2f}s")
     print(f"Saved to: {output_path}")
@@ -106,24 +110,46 @@ async def list_voices():
 
 async def check_status():
     """Check overall ElevenLabs configuration and status."""
-    from backend.services.tts_service import is_configured, get_remaining_credits
-
-    configured = is_configured()
-    print(f"API Key set:   {'Yes' if os.getenv('ELEVENLABS_API_KEY') else 'No'}")
-    print(f"Voice ID set:  {'Yes' if os.getenv('ELEVENLABS_VOICE_ID') else 'No'}")
-    print(f"Voice ID:      {os.getenv('ELEVENLABS_VOICE_ID', 'not set')}")
-    print(f"Model:         {os.getenv('ELEVENLABS_MODEL', 'eleven_multilingual_v2 (default)')}")
-    print(f"Output format: {os.getenv('ELEVENLABS_OUTPUT_FORMAT', 'mp3_44100_128 (default)')}")
+    from backend.services.tts_service import get_status
+
+    status = await get_status()
+
+    env = os.environ
+    api_key = env.get("ELEVENLABS_API_KEY")
+    voice_id = env.get("ELEVENLABS_VOICE_ID")
+    model = env.get("ELEVENLABS_MODEL", "eleven_multilingual_v2 (default)")
+    output_format = env.get("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128 (default)")
+
+    configured = status["configured"]
+    print(f"API Key set:   {'Yes' if api_key else 'No'}")
+    print(f"Voice ID set:  {'Yes' if voice_id else 'No'}")
+    print(f"Voice ID:      {voice_id or 'not set'}")
+    print(f"Model:         {model}")
+    print(f"Output format: {output_format}")
     print(f"Configured:    {'Yes' if configured else 'No'}")
 
     if configured:
-        credits = await get_remaining_credits()
+        credits = status["credits"]
         if credits is not None:
             print(f"Credits:       {credits:,}")
         else:
             print("Credits:       Failed to check")
 
 
+async def _run_and_close(command):
+    """Run one CLI command, then close the service's shared HTTP client.
+
+    Closing inside the event loop avoids unclosed-transport warnings when
+    asyncio.run() tears the loop down.
+    """
+    from backend.services.tts_service import close_client
+
+    try:
+        await command
+    finally:
+        await close_client()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ElevenLabs TTS tool",
@@ -151,18 +177,21 @@ Examples:
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
 
     if args.status:
-        asyncio.run(check_status())
+        command = check_status()
     elif args.credits:
-        asyncio.run(check_credits())
+        command = check_credits()
     elif args.voices:
-        asyncio.run(list_voices())
+        command = list_voices()
     elif args.text:
         if args.stream:
-            asyncio.run(stream_test(args.text, args.output, args.model))
+            command = stream_test(args.text, args.output, args.model)
         else:
-            asyncio.run(generate(args.text, args.output, args.model))
+            command = generate(args.text, args.output, args.model)
     else:
         parser.print_help()
+        return
+
+    asyncio.run(_run_and_close(command))
 
 
 if __name__ == "__main__":
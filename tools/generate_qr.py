@@ -37,15 +37,13 @@ def generate_qr(url: str, output_path: str, size: int = 10):
         qr.add_data(url)
         qr.make(fit=True)
 
-        img = qr.make_image(fill_color="white", back_color="transparent")
+        # Rasterize once in 1-bit, then recolor through a two-entry palette:
+        # index 0 is the dark background, index 1 the white modules
+        matrix = qr.make_image().get_image()
+        img = matrix.convert("L").point(lambda v: 0 if v else 1)
+        img.putpalette([15, 12, 41, 255, 255, 255])
 
-        # Save with transparent background if possible
-        try:
-            img = qr.make_image(fill_color="white", back_color=(15, 12, 41))
-        except Exception:
-            pass
-
-        img.save(output_path)
+        img.save(output_path, optimize=True, bits=1)
         print(f"QR code saved to: {output_path}")
         print(f"URL encoded: {url}")
 
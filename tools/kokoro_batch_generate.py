@@ -18,47 +18,71 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
-import yaml
+import aiofiles
+import httpx
+
+# Add project root to path so the tools can share helpers
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils import json_loads  # noqa: E402
+from tools._common import (  # noqa: E402
+    config_basename,
+    load_yaml_cached,
+    write_json_atomic,
+)
+
+# Bytes per read when streaming audio from Kokoro to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Retry backoff; module-level so tests can skip the waits for this module only
+_sleep = asyncio.sleep
 
 
 def load_presentation_config(config_path: str) -> dict:
-    """Load presentation configuration from YAML."""
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load presentation configuration from YAML.
 
+    Repeated loads of an unchanged file return the same cached dict; treat it
+    as read-only.
+    """
+    return load_yaml_cached(str(config_path), os.stat(config_path).st_mtime_ns)
 
-def collect_audio_jobs(config: dict, slide_filter: list[int] | None = None) -> list[dict]:
-    """Extract all audio generation jobs from the presentation config.
 
-    Returns a list of dicts with keys: slide_id, title, label, text, audio_filename.
+def iter_audio_jobs(config: dict, slide_filter: list[int] | None = None) -> Iterator[dict]:
+    """Yield audio generation jobs from the presentation config, in slide order.
+
+    Each job is a dict with keys: slide_id, title, label, text, text_bytes
+    (the text pre-encoded as UTF-8 for file writes), audio_filename.
     """
-    jobs = []
-    slides = config.get("slides", [])
+    wanted = frozenset(slide_filter) if slide_filter else None
 
-    for slide in slides:
+    for slide in config.get("slides", []):
         slide_id = slide.get("id", -1)
-        title = slide.get("title", "Untitled")
-
-        if slide_filter and slide_id not in slide_filter:
+        if wanted is not None and slide_id not in wanted:
             continue
 
+        title = slide.get("title", "Untitled")
         narration = slide.get("narration")
         audio_file = slide.get("audio_file")
 
         if narration and audio_file:
-            jobs.append({
+            text = narration.strip()
+            yield {
                 "slide_id": slide_id,
                 "title": title,
                 "label": f"slide_{slide_id:02d}_narration",
-                "text": narration.strip(),
-                "audio_filename": Path(audio_file).name,
-            })
+                "text": text,
+                "text_bytes": text.encode("utf-8"),
+                "audio_filename": config_basename(audio_file),
+            }
 
         # Interaction question audio
         interaction = slide.get("interaction")
@@ -66,15 +90,35 @@ def collect_audio_jobs(config: dict, slide_filter: list[int] | None = None) -> l
             q_text = interaction.get("question")
             q_audio = interaction.get("question_audio")
             if q_text and q_audio:
-                jobs.append({
+                text = q_text.strip()
+                yield {
                     "slide_id": slide_id,
                     "title": f"{title} — Interaction Q",
                     "label": f"slide_{slide_id:02d}_ask",
-                    "text": q_text.strip(),
-                    "audio_filename": Path(q_audio).name,
-                })
+                    "text": text,
+                    "text_bytes": text.encode("utf-8"),
+                    "audio_filename": config_basename(q_audio),
+                }
 
-    return jobs
+
+def collect_audio_jobs(config: dict, slide_filter: list[int] | None = None) -> list[dict]:
+    """Extract all audio generation jobs from the presentation config.
+
+    List form of iter_audio_jobs, for callers that need len() or several passes.
+    """
+    return list(iter_audio_jobs(config, slide_filter))
+
+
+def _write_file(path: Path, data: bytes):
+    """Write a whole file with a single open/write/close."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def export_text_files(jobs: list[dict], output_dir: Path):
@@ -104,42 +148,52 @@ def export_text_files(jobs: list[dict], output_dir: Path):
         "# Files:",
     ]
 
-    for job in jobs:
-        txt_name = job["audio_filename"].replace(".mp3", ".txt")
-        txt_path = output_dir / txt_name
-
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(job["text"])
-
-        char_count = len(job["text"])
-        print(f"  [OK] {txt_name} ({char_count} chars) — Slide {job['slide_id']}: {job['title']}")
-        readme_lines.append(f"#   {txt_name} -> frontend/audio/{job['audio_filename']}")
+    # Swap only the extension; str.replace would also hit ".mp3" mid-name
+    splitext = os.path.splitext
+    txt_names = [splitext(job["audio_filename"])[0] + ".txt" for job in jobs]
+
+    # Small files: overlap the per-file filesystem latency across threads
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        writes = pool.map(
+            _write_file,
+            [output_dir / name for name in txt_names],
+            [job["text_bytes"] for job in jobs],
+        )
+        for job, txt_name, _ in zip(jobs, txt_names, writes):
+            char_count = len(job["text"])
+            print(f"  [OK] {txt_name} ({char_count} chars) — Slide {job['slide_id']}: {job['title']}")
+            readme_lines.append(f"#   {txt_name} -> frontend/audio/{job['audio_filename']}")
 
     # Write README
     readme_path = output_dir / "README.txt"
-    with open(readme_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(readme_lines) + "\n")
+    _write_file(readme_path, ("\n".join(readme_lines) + "\n").encode("utf-8"))
 
     print(f"\n  README written to: {readme_path}")
 
 
-def generate_audio(text: str, output_path: str, voice: str = "af_heart",
-                   kokoro_url: str = "http://localhost:8880") -> bool:
+async def generate_audio(client: httpx.AsyncClient, text: str, output_path: str,
+                         voice: str = "af_heart", kokoro_url: str = "http://localhost:8880",
+                         max_retries: int = 2) -> int | None:
     """Generate audio from text using Kokoro TTS via OpenAI-compatible REST API.
 
-    Calls POST /v1/audio/speech on the Kokoro Docker instance.
+    Calls POST /v1/audio/speech on the Kokoro Docker instance in streaming
+    mode and writes chunks to ``<output_path>.part`` as they arrive, so the
+    whole file is never held in memory. The part file replaces output_path
+    only once the response is complete. Busy-server responses (429/5xx) and
+    transport failures (refused connections, timeouts, dropped streams) are
+    retried with exponential backoff; other 4xx errors are not.
 
     Args:
+        client: Shared HTTP client (see run_jobs).
         text: The narration text to synthesize.
-        output_path: Path to save the output audio file.
+        output_path: Destination file; its extension selects the audio format.
         voice: Kokoro voice ID to use.
         kokoro_url: Base URL of the Kokoro API server (no trailing slash).
+        max_retries: Number of retries on transient failures.
 
     Returns:
-        True if generation succeeded, False otherwise.
+        Number of bytes written, or None if generation failed.
     """
-    import httpx
-
     base = kokoro_url.rstrip("/")
     url = f"{base}/v1/audio/speech"
 
@@ -152,50 +206,127 @@ def generate_audio(text: str, output_path: str, voice: str = "af_heart",
         "voice": voice,
         "response_format": response_format,
         "speed": 1.0,
-        "stream": False,
+        "stream": True,
     }
+    part_path = output_path + ".part"
 
     try:
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-
-            with open(output_path, "wb") as f:
-                f.write(resp.content)
-
-            size_kb = len(resp.content) / 1024
-            print(f"  [OK] Generated: {output_path} ({size_kb:.1f} KB)")
-            return True
-
-    except httpx.HTTPStatusError as e:
-        print(f"  [ERROR] Kokoro API error {e.response.status_code}: {e.response.text[:200]}")
-        return False
-    except httpx.ConnectError:
-        print(f"  [ERROR] Cannot connect to Kokoro at {base}")
-        print(f"  Is Kokoro running? Check: {base}/health")
-        return False
-    except Exception as e:
-        print(f"  [ERROR] Failed to generate {output_path}: {e}")
-        return False
-
-
-def update_manifest(audio_dir: Path, jobs: list[dict], results: dict[str, str]):
+        for attempt in range(max_retries + 1):
+            try:
+                async with client.stream("POST", url, json=payload) as resp:
+                    if resp.is_error:
+                        await resp.aread()
+                    resp.raise_for_status()
+                    size_bytes = 0
+                    async with aiofiles.open(part_path, "wb") as f:
+                        async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                            await f.write(chunk)
+                            size_bytes += len(chunk)
+                os.replace(part_path, output_path)
+                return size_bytes
+
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if (status == 429 or status >= 500) and attempt < max_retries:
+                    await _sleep(2 ** attempt)
+                    continue
+                print(f"  [ERROR] Kokoro API error {status}: {e.response.text[:200]}")
+                return None
+            except httpx.TransportError as e:
+                # Refused connections, timeouts, and streams cut off mid-body
+                if attempt < max_retries:
+                    await _sleep(2 ** attempt)
+                    continue
+                if isinstance(e, httpx.ConnectError):
+                    print(f"  [ERROR] Cannot connect to Kokoro at {base}")
+                    print(f"  Is Kokoro running? Check: {base}/health")
+                elif isinstance(e, httpx.TimeoutException):
+                    print(f"  [ERROR] Kokoro timed out generating {output_path}")
+                else:
+                    print(f"  [ERROR] Connection to Kokoro failed generating {output_path}: {e!r}")
+                return None
+            except Exception as e:
+                print(f"  [ERROR] Failed to generate {output_path}: {e}")
+                return None
+
+        return None
+    finally:
+        # Left behind only by a failed or interrupted attempt
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+async def run_jobs(jobs: list[dict], output_dir: Path, voice: str, kokoro_url: str,
+                   concurrency: int = 4) -> dict[str, str]:
+    """Generate audio for all jobs, keeping up to ``concurrency`` requests in flight.
+
+    Each request streams straight to its output file (see generate_audio),
+    so disk writes overlap with synthesis without a separate writer.
+
+    Returns:
+        Mapping of audio filename -> "generated" or "failed".
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[str, str] = {}
+
+    async with httpx.AsyncClient(timeout=120.0) as client:
+        async def produce(job: dict):
+            output_path = output_dir / job["audio_filename"]
+            async with semaphore:
+                size_bytes = await generate_audio(client, job["text"], str(output_path), voice, kokoro_url)
+            if size_bytes is None:
+                results[job["audio_filename"]] = "failed"
+            else:
+                print(f"  [OK] Generated: {output_path} ({size_bytes / 1024:.1f} KB)")
+                results[job["audio_filename"]] = "generated"
+
+        outcomes = await asyncio.gather(*(produce(job) for job in jobs), return_exceptions=True)
+
+    for job, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"  [ERROR] Failed to generate {job['audio_filename']}: {outcome}")
+            results[job["audio_filename"]] = "failed"
+    return results
+
+
+def _load_manifest(manifest_path: Path) -> dict:
+    """Read audio_manifest.json, or return {} if it does not exist yet."""
+    try:
+        return json_loads(manifest_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+
+
+def _list_files(directory: Path) -> set[str]:
+    """Names of the regular files in directory, from one directory read."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def update_manifest(audio_dir: Path, jobs: list[dict], results: dict[str, str],
+                    existing_files: set[str] | None = None):
     """Update or create audio_manifest.json in the audio directory.
 
     The manifest tracks which audio files exist, their generation source,
-    and status (generated, missing, manual).
+    and status (generated, missing, manual). Pass ``existing_files`` (names
+    present in audio_dir) when already known to skip the directory read.
     """
+    if existing_files is None:
+        existing_files = _list_files(audio_dir)
+    now_iso = datetime.now().isoformat()  # one timestamp for the whole batch
     manifest_path = audio_dir / "audio_manifest.json"
 
-    # Load existing manifest if present
-    manifest = {}
-    if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
+    # Load existing manifest if present; entries are replaced, never
+    # mutated, so a shallow copy is enough to detect changes
+    original = _load_manifest(manifest_path)
+    manifest = dict(original)
 
     for job in jobs:
         filename = job["audio_filename"]
-        file_path = audio_dir / filename
+        file_exists = filename in existing_files
         existing = manifest.get(filename, {})
 
         entry = {
@@ -203,7 +334,7 @@ def update_manifest(audio_dir: Path, jobs: list[dict], results: dict[str, str]):
             "label": job["label"],
             "title": job["title"],
             "text_chars": len(job["text"]),
-            "exists": file_path.exists(),
+            "exists": file_exists,
             "source": existing.get("source", "unknown"),
             "last_updated": existing.get("last_updated"),
         }
@@ -212,18 +343,22 @@ def update_manifest(audio_dir: Path, jobs: list[dict], results: dict[str, str]):
         result = results.get(filename)
         if result == "generated":
             entry["source"] = "kokoro-batch"
-            entry["last_updated"] = datetime.now().isoformat()
+            entry["last_updated"] = now_iso
         elif result == "skipped-exists":
             pass  # Keep existing metadata
         elif result == "failed":
             entry["source"] = existing.get("source", "unknown")
-        elif file_path.exists() and entry["source"] == "unknown":
+        elif file_exists and entry["source"] == "unknown":
             entry["source"] = "manual"
 
         manifest[filename] = entry
 
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    # Leave the file (and its mtime) alone when nothing changed
+    if manifest == original:
+        print(f"\nManifest unchanged: {manifest_path}")
+        return
+
+    write_json_atomic(manifest_path, manifest)
 
     print(f"\nManifest updated: {manifest_path}")
 
@@ -264,10 +399,11 @@ Examples:
                         help="Skip audio files that already exist (preserve manual tweaks)")
     parser.add_argument("--slide", type=int, action="append", dest="slides",
                         help="Only process specific slide IDs (can be repeated: --slide 4 --slide 7)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Max Kokoro requests in flight at once (default: 4)")
     args = parser.parse_args()
 
     # Resolve paths relative to project root
-    project_root = Path(__file__).parent.parent
     config_path = project_root / args.config
     output_dir = project_root / args.output
 
@@ -303,47 +439,61 @@ Examples:
     print(f"Output directory: {output_dir}")
     print(f"Voice: {args.voice}")
     print(f"Skip existing: {args.skip_existing}")
+    print(f"Concurrency: {args.concurrency}")
     print()
 
     generated = 0
     skipped = 0
     failed = 0
     results: dict[str, str] = {}  # filename -> status
+    pending: list[dict] = []  # jobs to send to Kokoro
+    existing_files = _list_files(output_dir)  # one directory read instead of a stat per job
+
+    # The planning pass does no I/O, so its report is written in one go
+    lines: list[str] = []
+    add = lines.append
 
     for job in jobs:
         output_path = str(output_dir / job["audio_filename"])
 
-        print(f"Slide {job['slide_id']} ({job['title']}):")
-        print(f"  File: {job['audio_filename']}")
-        print(f"  Text: {job['text'][:80]}...")
+        add(f"Slide {job['slide_id']} ({job['title']}):")
+        add(f"  File: {job['audio_filename']}")
+        add(f"  Text: {job['text'][:80]}...")
 
         # Skip if file exists and --skip-existing is set
-        if args.skip_existing and Path(output_path).exists():
-            print(f"  [SKIP] Already exists: {output_path}")
+        if args.skip_existing and job["audio_filename"] in existing_files:
+            add(f"  [SKIP] Already exists: {output_path}")
             skipped += 1
             results[job["audio_filename"]] = "skipped-exists"
             continue
 
         if args.dry_run:
-            print(f"  [DRY RUN] Would generate: {output_path}")
+            add(f"  [DRY RUN] Would generate: {output_path}")
             generated += 1
             results[job["audio_filename"]] = "dry-run"
             continue
 
+        pending.append(job)
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    if pending:
+        print(f"\nGenerating {len(pending)} files...")
         kokoro_url = args.kokoro_url or os.getenv("KOKORO_API_URL", "http://localhost:8880")
-        if generate_audio(job["text"], output_path, args.voice, kokoro_url):
-            generated += 1
-            results[job["audio_filename"]] = "generated"
-        else:
-            failed += 1
-            results[job["audio_filename"]] = "failed"
+        generation = asyncio.run(run_jobs(pending, output_dir, args.voice, kokoro_url, args.concurrency))
+        results.update(generation)
+        generated += sum(1 for status in generation.values() if status == "generated")
+        failed += sum(1 for status in generation.values() if status == "failed")
 
     print()
     print(f"Done! Generated: {generated}, Skipped: {skipped}, Failed: {failed}")
 
     # Update manifest (unless dry-run)
     if not args.dry_run:
-        update_manifest(output_dir, jobs, results)
+        existing_files.update(name for name, status in results.items() if status == "generated")
+        update_manifest(output_dir, jobs, results, existing_files)
 
 
 if __name__ == "__main__":
@@ -8,9 +8,14 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils import yaml_load  # noqa: E402
 
 
 def validate_presentation(config_path: Path) -> list[str]:
@@ -21,7 +26,7 @@ def validate_presentation(config_path: Path) -> list[str]:
         return [f"File not found: {config_path}"]
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml_load(f)
 
     if not data:
         return ["Empty config file"]
@@ -44,7 +49,8 @@ def validate_presentation(config_path: Path) -> list[str]:
             errors.append(f"Slide missing 'id': {slide.get('title', 'unknown')}")
         elif sid in slide_ids:
             errors.append(f"Duplicate slide id: {sid}")
-        slide_ids.add(sid)
+        else:
+            slide_ids.add(sid)
 
         if not slide.get("title"):
             errors.append(f"Slide {sid}: missing title")
@@ -70,7 +76,7 @@ def validate_audience(config_path: Path) -> list[str]:
         return [f"File not found: {config_path}"]
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml_load(f)
 
     audience = data.get("audience", [])
     if not audience:
@@ -84,7 +90,8 @@ def validate_audience(config_path: Path) -> list[str]:
             errors.append("Audience member missing name")
         elif name in names:
             errors.append(f"Duplicate audience name: {name}")
-        names.add(name)
+        else:
+            names.add(name)
 
         if not member.get("question"):
             errors.append(f"{name}: missing question")
@@ -100,7 +107,7 @@ def validate_prompts(config_path: Path) -> list[str]:
         return [f"File not found: {config_path}"]
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml_load(f)
 
     prompts = data.get("system_prompts", {})
     required_prompts = ["audience_response", "qa_answer", "question_filter"]
@@ -118,28 +125,24 @@ def main():
     project_root = Path(__file__).parent.parent
     config_dir = project_root / "config"
 
+    validators = [
+        ("presentation.yaml", validate_presentation),
+        ("audience.yaml", validate_audience),
+        ("prompts.yaml", validate_prompts),
+    ]
+
     all_errors = []
 
-    print("Validating presentation.yaml...")
-    errors = validate_presentation(config_dir / "presentation.yaml")
-    all_errors.extend(errors)
-    print(f"  {'PASS' if not errors else f'FAIL ({len(errors)} errors)'}")
-    for e in errors:
-        print(f"    - {e}")
-
-    print("Validating audience.yaml...")
-    errors = validate_audience(config_dir / "audience.yaml")
-    all_errors.extend(errors)
-    print(f"  {'PASS' if not errors else f'FAIL ({len(errors)} errors)'}")
-    for e in errors:
-        print(f"    - {e}")
-
-    print("Validating prompts.yaml...")
-    errors = validate_prompts(config_dir / "prompts.yaml")
-    all_errors.extend(errors)
-    print(f"  {'PASS' if not errors else f'FAIL ({len(errors)} errors)'}")
-    for e in errors:
-        print(f"    - {e}")
+    # Independent files: read and parse them concurrently, report in order
+    with ThreadPoolExecutor(max_workers=len(validators)) as pool:
+        futures = [(name, pool.submit(fn, config_dir / name)) for name, fn in validators]
+        for name, future in futures:
+            print(f"Validating {name}...")
+            errors = future.result()
+            all_errors.extend(errors)
+            print(f"  {'PASS' if not errors else f'FAIL ({len(errors)} errors)'}")
+            for e in errors:
+                print(f"    - {e}")
 
     print()
     if all_errors: